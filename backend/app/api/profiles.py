@@ -1,33 +1,44 @@
-from fastapi import APIRouter, Depends, HTTPException, UploadFile, File
-from sqlalchemy.orm import Session
-from typing import List
-import os
-from datetime import datetime
+from fastapi import APIRouter, Depends, HTTPException, UploadFile, File, Request, Response
+from fastapi.routing import APIRoute
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import Any, Callable, Coroutine, List, Tuple
+import json
 
-from app.dependencies import get_db
-from app.auth.jwt import get_current_user, requires_permission
-from app.schemas.profile import ProfileCreate, Profile, ProfileUpdate, Resume, ResumeCreate
-from app.services.profile_service import ProfileService
+from app.dependencies import json_body
+from app.auth.jwt import authed_db
+from app.schemas.profile import ProfileCreate, Profile, ProfileUpdate, Resume
+from app.services.profile_service import ProfileService, MAX_RESUME_SIZE_BYTES
+from app.cache import get_cached, set_cached, invalidate
 
 router = APIRouter()
 
+PROFILE_CACHE_TTL_SECONDS = 300
+
 @router.get(
     "/profile", 
     response_model=Profile,
     summary="Get user profile"
 )
 async def get_profile(
-    current_user: dict = Depends(requires_permission(["read:profile"])),
-    db: Session = Depends(get_db)
+    ctx: Tuple[AsyncSession, dict] = Depends(authed_db(("read:profile",)))
 ):
     """
     Retrieve the profile for the authenticated user.
     """
+    db, current_user = ctx
+    cache_key = f"profile:{current_user['sub']}"
+    cached = await get_cached(cache_key)
+    if cached is not None:
+        return Response(content=cached, media_type="application/json")
+
     service = ProfileService(db)
-    profile = service.get_profile_by_user_id(current_user["sub"])
+    profile = await service.get_profile_by_user_id(current_user["sub"])
     if not profile:
         raise HTTPException(status_code=404, detail="Profile not found")
-    return profile
+
+    payload = Profile.model_validate(profile).model_dump_json().encode()
+    await set_cached(cache_key, payload, PROFILE_CACHE_TTL_SECONDS)
+    return Response(content=payload, media_type="application/json")
 
 @router.post(
     "/profile", 
@@ -35,15 +46,17 @@ async def get_profile(
     summary="Create user profile"
 )
 async def create_profile(
-    profile: ProfileCreate,
-    current_user: dict = Depends(requires_permission(["create:profile"])),
-    db: Session = Depends(get_db)
+    profile: ProfileCreate = Depends(json_body(ProfileCreate)),
+    ctx: Tuple[AsyncSession, dict] = Depends(authed_db(("create:profile",)))
 ):
     """
     Create a new profile for the authenticated user.
     """
+    db, current_user = ctx
     service = ProfileService(db)
-    return service.create_profile(current_user["sub"], profile)
+    created = await service.create_profile(current_user["sub"], profile)
+    await invalidate(f"profile:{current_user['sub']}")
+    return created
 
 @router.put(
     "/profile", 
@@ -52,29 +65,49 @@ async def create_profile(
 )
 async def update_profile(
     profile: ProfileUpdate,
-    current_user: dict = Depends(requires_permission(["update:profile"])),
-    db: Session = Depends(get_db)
+    ctx: Tuple[AsyncSession, dict] = Depends(authed_db(("update:profile",)))
 ):
     """
     Update the profile for the authenticated user.
     """
+    db, current_user = ctx
     service = ProfileService(db)
-    return service.update_profile(current_user["sub"], profile)
+    updated = await service.update_profile(current_user["sub"], profile)
+    await invalidate(f"profile:{current_user['sub']}")
+    return updated
+
+class ResumeUploadRoute(APIRoute):
+    """
+    Rejects uploads whose Content-Length exceeds the resume size limit.
+
+    Runs before FastAPI reads the request body, so an oversized multipart
+    form is refused without being received and spooled to disk; dependencies
+    and the endpoint itself only run after the form has been parsed.
+    """
+
+    def get_route_handler(self) -> Callable[[Request], Coroutine[Any, Any, Response]]:
+        route_handler = super().get_route_handler()
+
+        async def size_limited_handler(request: Request) -> Response:
+            content_length = request.headers.get("content-length")
+            if content_length and content_length.isdigit() and int(content_length) > MAX_RESUME_SIZE_BYTES:
+                raise HTTPException(
+                    status_code=413,
+                    detail="Resume file is too large"
+                )
+            return await route_handler(request)
+
+        return size_limited_handler
 
-@router.post(
-    "/resumes", 
-    response_model=Resume,
-    summary="Upload resume"
-)
 async def upload_resume(
     title: str,
     file: UploadFile = File(...),
-    current_user: dict = Depends(requires_permission(["create:resume"])),
-    db: Session = Depends(get_db)
+    ctx: Tuple[AsyncSession, dict] = Depends(authed_db(("create:resume",)))
 ):
     """
     Upload a new resume for the authenticated user.
     """
+    db, current_user = ctx
     if not file.content_type == "application/pdf":
         raise HTTPException(
             status_code=400, 
@@ -82,7 +115,18 @@ async def upload_resume(
         )
 
     service = ProfileService(db)
-    return await service.upload_resume(current_user["sub"], title, file)
+    resume = await service.upload_resume(current_user["sub"], title, file)
+    await invalidate(f"profile:{current_user['sub']}", f"resumes:{current_user['sub']}")
+    return resume
+
+router.add_api_route(
+    "/resumes",
+    upload_resume,
+    methods=["POST"],
+    response_model=Resume,
+    summary="Upload resume",
+    route_class_override=ResumeUploadRoute
+)
 
 @router.get(
     "/resumes", 
@@ -90,14 +134,25 @@ async def upload_resume(
     summary="Get user resumes"
 )
 async def get_resumes(
-    current_user: dict = Depends(requires_permission(["read:resume"])),
-    db: Session = Depends(get_db)
+    ctx: Tuple[AsyncSession, dict] = Depends(authed_db(("read:resume",)))
 ):
     """
     Retrieve all resumes for the authenticated user.
     """
+    db, current_user = ctx
+    cache_key = f"resumes:{current_user['sub']}"
+    cached = await get_cached(cache_key)
+    if cached is not None:
+        return Response(content=cached, media_type="application/json")
+
     service = ProfileService(db)
-    return service.get_resumes(current_user["sub"])
+    resumes = await service.get_resumes(current_user["sub"])
+
+    payload = json.dumps(
+        [Resume.model_validate(r).model_dump(mode="json") for r in resumes]
+    ).encode()
+    await set_cached(cache_key, payload, PROFILE_CACHE_TTL_SECONDS)
+    return Response(content=payload, media_type="application/json")
 
 @router.delete(
     "/resumes/{resume_id}",
@@ -105,12 +160,13 @@ async def get_resumes(
 )
 async def delete_resume(
     resume_id: int,
-    current_user: dict = Depends(requires_permission(["delete:resume"])),
-    db: Session = Depends(get_db)
+    ctx: Tuple[AsyncSession, dict] = Depends(authed_db(("delete:resume",)))
 ):
     """
     Delete a specific resume for the authenticated user.
     """
+    db, current_user = ctx
     service = ProfileService(db)
     await service.delete_resume(current_user["sub"], resume_id)
+    await invalidate(f"profile:{current_user['sub']}", f"resumes:{current_user['sub']}")
     return {"message": "Resume deleted successfully"}
\ No newline at end of file
@@ -1,57 +1,92 @@
-from fastapi import APIRouter, Depends, HTTPException, status, Query
-from sqlalchemy.orm import Session
-from typing import List, Optional, Dict
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Request, Response
+from sqlalchemy import select, update, delete
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import List, Optional, Dict, Tuple
 from app.dependencies import get_db
 from app.models.job import Job
 from app.schemas.job import JobCreate, JobUpdate, JobInDB
-from ..services.job_parser import JobParserService
+from app.dependencies import container, json_body
+from app.services.job_parser import JobParser
 from app.models.user import User
-from app.auth.jwt import get_current_user, requires_permission  
+from app.auth.jwt import get_current_user, requires_permission, authed_db
+from app.cache import get_cached, set_cached, invalidate
 import logging
+import orjson
 from pydantic import BaseModel
-from aiohttp import ClientTimeout
-import aiohttp
+from cachetools import TTLCache
 
 
 logger = logging.getLogger(__name__)
 router = APIRouter()
 
+JOBS_CACHE_TTL_SECONDS = 60
+
+# Auth0 subjects known to be registered; lets repeat /register calls skip the DB
+_registered_users: TTLCache = TTLCache(maxsize=10_000, ttl=300)
+
+# Columns emitted by the read_jobs fast path; mirrors JobInDB so rows can be
+# encoded straight to JSON without building a Pydantic model per row
+JOB_LIST_COLUMNS = (
+    Job.id,
+    Job.title,
+    Job.company,
+    Job.description,
+    Job.status,
+    Job.date_applied,
+    Job.notes,
+)
+
+
+def _to_job_in_db(job: Job) -> JobInDB:
+    """
+    Build the response model from a persisted row without re-validating it
+
+    Values come from the database and were validated on write, so
+    model_construct skips the validator chain entirely.
+    """
+    return JobInDB.model_construct(**{c.key: getattr(job, c.key) for c in JOB_LIST_COLUMNS})
+
 @router.get("/health")
 async def health_check():
     return {"status": "healthy"}
 
 @router.get("/health/ollama")
-async def check_ollama():
+async def check_ollama(request: Request):
     try:
-        timeout = ClientTimeout(total=5)
-        async with aiohttp.ClientSession(timeout=timeout) as session:
-            async with session.post(
-                "http://ollama:11434/api/generate",
-                json={
-                    "model": "tinyllama",
-                    "prompt": "test",
-                    "stream": False
-                }
-            ) as response:
-                if response.status == 200:
-                    return {"status": "healthy", "ollama": "connected"}
-                return {"status": "unhealthy", "ollama": f"error: {response.status}"}
+        response = await request.app.state.http.post(
+            "http://ollama:11434/api/generate",
+            json={
+                "model": "tinyllama",
+                "prompt": "test",
+                "stream": False
+            },
+            timeout=5.0
+        )
+        if response.status_code == 200:
+            return {"status": "healthy", "ollama": "connected"}
+        return {"status": "unhealthy", "ollama": f"error: {response.status_code}"}
     except Exception as e:
         return {"status": "unhealthy", "ollama": str(e)}
 
 
 @router.post("/register")
 async def register_user(
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user: Dict = Depends(get_current_user)  # From Auth0
 ):
+    sub = current_user.get("sub")
+    if sub in _registered_users:
+        return {"message": "User already registered"}
+
     try:
         # Check if user already exists
-        existing_user = db.query(User).filter(
-            User.auth0_id == current_user.get("sub")
-        ).first()
+        result = await db.execute(
+            select(User).where(User.auth0_id == sub)
+        )
+        existing_user = result.scalar_one_or_none()
         
         if existing_user:
+            _registered_users[sub] = True
             return {"message": "User already registered"}
             
         # Create new user
@@ -61,13 +96,13 @@ async def register_user(
         )
         
         db.add(new_user)
-        db.commit()
-        db.refresh(new_user)
+        await db.commit()
+        _registered_users[sub] = True
         
         return {"message": "User registered successfully"}
         
     except Exception as e:
-        db.rollback()
+        await db.rollback()
         logger.error(f"Registration error: {str(e)}")
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -83,157 +118,132 @@ async def read_jobs(
     skip: int = Query(default=0, ge=0),
     limit: int = Query(default=100, le=100),
     search: Optional[str] = Query(None, description="Search term for job title or company"),
-    db: Session = Depends(get_db),
-    current_user: Dict = Depends(requires_permission(["read:jobs"]))  # Changed auth dependency
+    ctx: Tuple[AsyncSession, Dict] = Depends(authed_db(("read:jobs",)))
 ):
     """
     Retrieve all jobs for the authenticated user with pagination and search.
     """
-    try:
-        logger.debug(f"User attempting to fetch jobs: {current_user.get('sub')}")
-        
-        query = db.query(Job).filter(Job.user_id == current_user.get("sub"))
-        
-        if search:
-            search_term = f"%{search}%"
-            query = query.filter(
-                (Job.title.ilike(search_term)) |
-                (Job.company.ilike(search_term))
-            )
-        
-        total = query.count()
-        jobs = query.offset(skip).limit(limit).all()
-        
-        logger.info(f"Retrieved {len(jobs)} jobs for user {current_user.get('sub')}")
-        return jobs
+    db, current_user = ctx
+    logger.debug("User attempting to fetch jobs: %s", current_user.get('sub'))
 
-    except Exception as e:
-        logger.error(f"Error retrieving jobs: {str(e)}")
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Error retrieving jobs"
+    cache_key = f"jobs:{current_user.get('sub')}:{skip}:{limit}:{search or ''}"
+    cached = await get_cached(cache_key)
+    if cached is not None:
+        return Response(content=cached, media_type="application/json")
+    
+    query = select(*JOB_LIST_COLUMNS).where(Job.user_id == current_user.get("sub"))
+    
+    if search:
+        search_term = f"%{search}%"
+        query = query.where(
+            (Job.title.ilike(search_term)) |
+            (Job.company.ilike(search_term))
         )
+    
+    result = await db.execute(query.order_by(Job.id).offset(skip).limit(limit))
+    jobs = [dict(row) for row in result.mappings()]
+    
+    logger.info(f"Retrieved {len(jobs)} jobs for user {current_user.get('sub')}")
+    payload = orjson.dumps(jobs)
+    await set_cached(cache_key, payload, JOBS_CACHE_TTL_SECONDS)
+    return Response(content=payload, media_type="application/json")
 
 @router.post(
     "/jobs",
-    response_model=JobInDB,
-    status_code=status.HTTP_201_CREATED
+    status_code=status.HTTP_201_CREATED,
+    responses={status.HTTP_201_CREATED: {"model": JobInDB}}
 )
 async def create_job(
-    job: JobCreate,
-    db: Session = Depends(get_db),
-    current_user: Dict = Depends(requires_permission(["create:jobs"]))  # Changed auth dependency
+    job: JobCreate = Depends(json_body(JobCreate)),
+    ctx: Tuple[AsyncSession, Dict] = Depends(authed_db(("create:jobs",)))
 ):
     """
     Create a new job entry for the authenticated user.
     """
-    try:
-        logger.debug(f"Received job creation request")
-        logger.debug(f"Current user: {current_user}")
-        logger.debug(f"Job data: {job.dict()}")
-        
-        db_job = Job(**job.dict(), user_id=current_user.get("sub"))
-        db.add(db_job)
-        db.commit()
-        db.refresh(db_job)
-        
-        logger.info(f"Created job {db_job.id} for user {current_user.get('sub')}")
-        return db_job
-
-    except Exception as e:
-        db.rollback()
-        logger.error(f"Error creating job: {str(e)}")
-        logger.exception(e)
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Error creating job: {str(e)}"
-        )
+    db, current_user = ctx
+    data = job.model_dump(exclude_unset=True, exclude={"resume"})
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Received job creation request")
+        logger.debug("Current user: %s", current_user)
+        logger.debug("Job data: %s", data)
+    
+    db_job = Job(**data, user_id=current_user.get("sub"))
+    db.add(db_job)
+    await db.commit()
+    await db.refresh(db_job)
+    await invalidate(f"jobs:{current_user.get('sub')}:*")
+    
+    logger.info(f"Created job {db_job.id} for user {current_user.get('sub')}")
+    return _to_job_in_db(db_job)
 
 @router.put(
     "/jobs/{job_id}",
-    response_model=JobInDB
+    responses={status.HTTP_200_OK: {"model": JobInDB}}
 )
 async def update_job(
     job_id: int,
     job: JobUpdate,
-    db: Session = Depends(get_db),
-    current_user: Dict = Depends(requires_permission(["update:jobs"]))  # Changed auth dependency
+    ctx: Tuple[AsyncSession, Dict] = Depends(authed_db(("update:jobs",)))
 ):
     """
     Update a specific job for the authenticated user.
     """
-    try:
-        db_job = db.query(Job).filter(
-            Job.id == job_id,
-            Job.user_id == current_user.get("sub")
-        ).first()
-        
-        if not db_job:
-            logger.warning(f"Job {job_id} not found for user {current_user.get('sub')}")
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="Job not found"
-            )
-            
-        for key, value in job.dict(exclude_unset=True).items():
-            setattr(db_job, key, value)
-            
-        db.commit()
-        db.refresh(db_job)
-        
-        logger.info(f"Updated job {job_id} for user {current_user.get('sub')}")
-        return db_job
+    db, current_user = ctx
+    owned = (Job.id == job_id, Job.user_id == current_user.get("sub"))
+    # resume is a relationship, not a column, so it can't be SET directly
+    values = job.model_dump(exclude_unset=True, exclude={"resume"})
 
-    except HTTPException:
-        raise
-    except Exception as e:
-        db.rollback()
-        logger.error(f"Error updating job {job_id}: {str(e)}")
+    if values:
+        stmt = update(Job).where(*owned).values(**values).returning(*JOB_LIST_COLUMNS)
+    else:
+        stmt = select(*JOB_LIST_COLUMNS).where(*owned)
+    result = await db.execute(stmt)
+    row = result.mappings().one_or_none()
+    
+    if row is None:
+        logger.warning(f"Job {job_id} not found for user {current_user.get('sub')}")
         raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Error updating job"
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Job not found"
         )
+        
+    await db.commit()
+    await invalidate(f"jobs:{current_user.get('sub')}:*")
+    
+    logger.info(f"Updated job {job_id} for user {current_user.get('sub')}")
+    return JobInDB.model_construct(**row)
 
 @router.delete(
     "/jobs/{job_id}",
-    response_model=JobInDB
+    responses={status.HTTP_200_OK: {"model": JobInDB}}
 )
 async def delete_job(
     job_id: int,
-    db: Session = Depends(get_db),
-    current_user: Dict = Depends(requires_permission(["delete:jobs"]))  # Changed auth dependency
+    ctx: Tuple[AsyncSession, Dict] = Depends(authed_db(("delete:jobs",)))
 ):
     """
     Delete a specific job for the authenticated user.
     """
-    try:
-        db_job = db.query(Job).filter(
-            Job.id == job_id,
-            Job.user_id == current_user.get("sub")
-        ).first()
-        
-        if not db_job:
-            logger.warning(f"Job {job_id} not found for user {current_user.get('sub')}")
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="Job not found"
-            )
-            
-        db.delete(db_job)
-        db.commit()
-        
-        logger.info(f"Deleted job {job_id} for user {current_user.get('sub')}")
-        return db_job
-
-    except HTTPException:
-        raise
-    except Exception as e:
-        db.rollback()
-        logger.error(f"Error deleting job {job_id}: {str(e)}")
+    db, current_user = ctx
+    result = await db.execute(
+        delete(Job)
+        .where(Job.id == job_id, Job.user_id == current_user.get("sub"))
+        .returning(*JOB_LIST_COLUMNS)
+    )
+    row = result.mappings().one_or_none()
+    
+    if row is None:
+        logger.warning(f"Job {job_id} not found for user {current_user.get('sub')}")
         raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Error deleting job"
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Job not found"
         )
+        
+    await db.commit()
+    await invalidate(f"jobs:{current_user.get('sub')}:*")
+    
+    logger.info(f"Deleted job {job_id} for user {current_user.get('sub')}")
+    return JobInDB.model_construct(**row)
 
 
 class UrlRequest(BaseModel):
@@ -241,26 +251,26 @@ class UrlRequest(BaseModel):
 
 @router.post("/jobs/parse-url", response_model=Dict)
 async def parse_job_url(
-    url_data: UrlRequest,
-    current_user: Dict = Depends(requires_permission(["create:jobs"])),  # Added auth requirement
-    job_parser: JobParserService = Depends(lambda: JobParserService())
+    url_data: UrlRequest = Depends(json_body(UrlRequest)),
+    current_user: Dict = Depends(requires_permission(("create:jobs",))),  # Added auth requirement
+    job_parser: JobParser = Depends(container.get_job_parser)
 ):
     try:
-        logger.debug(f"Attempting to parse URL: {url_data.url}")
-        job_details = await job_parser.parse_job_details(url_data.url)
-        logger.debug(f"Raw job details: {job_details}")
+        logger.debug("Attempting to parse URL: %s", url_data.url)
+        job_details = await job_parser.parse_job_posting(url_data.url)
+        logger.debug("Raw job details: %s", job_details)
         
         formatted_response = {
-            "job_title": job_details.get("job_title"),
-            "company_name": job_details.get("company_name"),
+            "job_title": job_details.get("title"),
+            "company_name": job_details.get("company"),
             "description": job_details.get("description"),
             "location": job_details.get("location"),
             "salary_range": job_details.get("salary_range"),
-            "required_experience": job_details.get("required_experience"),
-            "key_skills": job_details.get("key_skills", [])
+            "required_experience": job_details.get("experience_level"),
+            "key_skills": job_details.get("requirements", [])
         }
         
-        logger.debug(f"Formatted response: {formatted_response}")
+        logger.debug("Formatted response: %s", formatted_response)
         return formatted_response
         
     except Exception as e:
@@ -1,10 +1,12 @@
 from datetime import datetime, timedelta
-from typing import Optional, Dict
+from functools import lru_cache
+from typing import Optional, Dict, Tuple
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
-from jose import JWTError, jwt
+import jwt
 from passlib.context import CryptContext
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from app.dependencies import get_db
 from app.models.user import User
 
@@ -35,7 +37,7 @@ def create_access_token(data: Dict, expires_delta: Optional[timedelta] = None) -
 
 async def get_current_user(
     token: str = Depends(oauth2_scheme),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ) -> Dict:
     credentials_exception = HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
@@ -48,10 +50,11 @@ async def get_current_user(
         user_id: str = payload.get("sub")
         if user_id is None:
             raise credentials_exception
-    except JWTError:
+    except jwt.InvalidTokenError:
         raise credentials_exception
         
-    user = db.query(User).filter(User.id == user_id).first()
+    result = await db.execute(select(User).where(User.id == user_id))
+    user = result.scalar_one_or_none()
     if user is None:
         raise credentials_exception
         
@@ -61,20 +64,43 @@ async def get_current_user(
         "permissions": user.permissions.split(",") if user.permissions else []
     }
 
-def requires_permission(required_permissions: Optional[list] = None):
+@lru_cache(maxsize=64)
+def requires_permission(required_permissions: Optional[Tuple[str, ...]] = None):
+    """
+    Build a dependency that enforces the given permissions.
+
+    Cached on the permission tuple so routes declaring the same scopes share
+    one dependency callable; the required set is frozen once at build time.
+    """
+    required = frozenset(required_permissions) if required_permissions else None
+
     async def wrapper(current_user: Dict = Depends(get_current_user)):
-        if required_permissions is None:
+        if required is None:
             return current_user
-            
-        user_permissions = current_user.get("permissions", [])
-        
-        for permission in required_permissions:
-            if permission not in user_permissions:
-                raise HTTPException(
-                    status_code=status.HTTP_403_FORBIDDEN,
-                    detail="Insufficient permissions"
-                )
-        
+
+        if not required.issubset(current_user.get("permissions", ())):
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail="Insufficient permissions"
+            )
+
         return current_user
-        
-    return wrapper
\ No newline at end of file
+
+    return wrapper
+
+
+@lru_cache(maxsize=64)
+def authed_db(required_permissions: Optional[Tuple[str, ...]] = None):
+    """
+    Build a single dependency yielding ``(db, current_user)`` for a route.
+
+    Collapses the per-route session and permission dependencies into one
+    cached callable; the session is shared with get_current_user.
+    """
+    async def dependency(
+        db: AsyncSession = Depends(get_db),
+        current_user: Dict = Depends(requires_permission(required_permissions))
+    ) -> Tuple[AsyncSession, Dict]:
+        return db, current_user
+
+    return dependency
@@ -0,0 +1,150 @@
+"""
+Redis-backed response cache
+
+Thin async helpers over the configured REDIS_URL, plus a synchronous
+invalidation helper for Celery tasks. Cache errors are logged and treated as
+misses so an unavailable Redis never fails a request.
+"""
+import hashlib
+import logging
+from typing import Optional
+
+from fastapi import Request, Response
+from redis import Redis as SyncRedis
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+_client: Optional[Redis] = None
+_sync_client: Optional[SyncRedis] = None
+
+
+def get_redis() -> Redis:
+    """
+    Get the shared async Redis client (created lazily)
+
+    Returns:
+        Redis client bound to settings.REDIS_URL
+    """
+    global _client
+    if _client is None:
+        _client = Redis.from_url(settings.REDIS_URL)
+    return _client
+
+
+async def get_cached(key: str) -> Optional[bytes]:
+    """
+    Read a cached payload
+
+    Args:
+        key: Cache key
+
+    Returns:
+        Cached bytes, or None on miss or Redis error
+    """
+    try:
+        return await get_redis().get(key)
+    except RedisError as e:
+        logger.warning(f"Cache read failed for {key}: {str(e)}")
+        return None
+
+
+async def set_cached(key: str, value: bytes, ttl_seconds: int) -> None:
+    """
+    Store a payload with an expiry
+
+    Args:
+        key: Cache key
+        value: Serialized payload
+        ttl_seconds: Time to live in seconds
+    """
+    try:
+        await get_redis().setex(key, ttl_seconds, value)
+    except RedisError as e:
+        logger.warning(f"Cache write failed for {key}: {str(e)}")
+
+
+async def invalidate(*patterns: str) -> None:
+    """
+    Delete every key matching the given glob patterns
+
+    Args:
+        patterns: Redis glob patterns, e.g. "jobs:<user>:*"
+    """
+    try:
+        client = get_redis()
+        for pattern in patterns:
+            keys = [key async for key in client.scan_iter(match=pattern, count=500)]
+            if keys:
+                await client.delete(*keys)
+    except RedisError as e:
+        logger.warning(f"Cache invalidation failed for {patterns}: {str(e)}")
+
+
+async def claim(key: str, ttl_seconds: int) -> bool:
+    """
+    Set a marker key unless it already exists, for debouncing work
+
+    Args:
+        key: Marker key
+        ttl_seconds: How long the claim holds
+
+    Returns:
+        True if this caller set the marker (or Redis is unavailable, so the
+        work is never skipped), False if a live claim already existed
+    """
+    try:
+        return bool(await get_redis().set(key, b"1", nx=True, ex=ttl_seconds))
+    except RedisError as e:
+        logger.warning(f"Cache claim failed for {key}: {str(e)}")
+        return True
+
+
+def invalidate_sync(*patterns: str) -> None:
+    """
+    Delete every key matching the given glob patterns from synchronous code
+
+    Used by Celery tasks, which have no running event loop to drive the
+    async client.
+
+    Args:
+        patterns: Redis glob patterns, e.g. "skills:*"
+    """
+    global _sync_client
+    try:
+        if _sync_client is None:
+            _sync_client = SyncRedis.from_url(settings.REDIS_URL)
+        for pattern in patterns:
+            keys = list(_sync_client.scan_iter(match=pattern, count=500))
+            if keys:
+                _sync_client.delete(*keys)
+    except RedisError as e:
+        logger.warning(f"Cache invalidation failed for {patterns}: {str(e)}")
+
+
+def etag_response(request: Request, payload: bytes) -> Response:
+    """
+    Build a JSON response carrying an ETag, or a 304 if the client has it
+
+    Args:
+        request: Incoming request, checked for If-None-Match
+        payload: Serialized JSON body
+
+    Returns:
+        304 Not Modified when the client's ETag matches, else the payload
+    """
+    etag = f'"{hashlib.sha1(payload).hexdigest()}"'
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers={"ETag": etag})
+    return Response(content=payload, media_type="application/json", headers={"ETag": etag})
+
+
+async def close_cache() -> None:
+    """Close the shared Redis client"""
+    global _client
+    if _client is not None:
+        await _client.close()
+        _client = None
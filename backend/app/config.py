@@ -1,11 +1,20 @@
 # app/config.py
 from pydantic_settings import BaseSettings, SettingsConfigDict
+from functools import cached_property
 from typing import List
 import json
 
 class Settings(BaseSettings):
     # Database settings
     DATABASE_URL: str
+    DB_POOL_SIZE: int = 20
+    DB_MAX_OVERFLOW: int = 20
+    DB_POOL_TIMEOUT: int = 5
+    DB_POOL_RECYCLE: int = 1800
+    DB_POOL_PRE_PING: bool = False
+    DB_QUERY_CACHE_SIZE: int = 1200
+    # Set when connections go through an external pooler such as PgBouncer
+    DB_EXTERNAL_POOLER: bool = False
     
     # Redis settings
     REDIS_URL: str = "redis://redis:6379/0"
@@ -17,7 +26,7 @@ class Settings(BaseSettings):
     AUTH0_CLIENT_SECRET: str
     ALLOWED_ORIGINS: str = "http://localhost:3000"
 
-    @property
+    @cached_property
     def CORS_ORIGINS(self) -> List[str]:
         try:
             return json.loads(self.ALLOWED_ORIGINS)
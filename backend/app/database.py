@@ -1,14 +1,59 @@
-from sqlalchemy import create_engine
+import asyncio
+import logging
+from sqlalchemy import create_engine, text
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import NullPool
 from app.config import settings
 
+logger = logging.getLogger(__name__)
+
+# Pool options shared by both engines. Pre-ping is off by default: recycling
+# bounds connection age and a disconnect error invalidates the pool, so a
+# SELECT 1 per checkout isn't worth the round-trip. Behind an external pooler
+# a second layer of pooling only pins server connections, so use NullPool.
+if settings.DB_EXTERNAL_POOLER:
+    POOL_OPTIONS = {"poolclass": NullPool}
+else:
+    POOL_OPTIONS = {
+        "pool_size": settings.DB_POOL_SIZE,
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+        "pool_timeout": settings.DB_POOL_TIMEOUT,
+        "pool_recycle": settings.DB_POOL_RECYCLE,
+        "pool_pre_ping": settings.DB_POOL_PRE_PING,
+        "pool_reset_on_return": "rollback",
+    }
+
 # Create SQLAlchemy engine
-engine = create_engine(settings.DATABASE_URL)
+engine = create_engine(
+    settings.DATABASE_URL,
+    **POOL_OPTIONS,
+    query_cache_size=settings.DB_QUERY_CACHE_SIZE,
+    # Batch executemany() inserts (scraped jobs) into multi-row statements
+    executemany_mode="values_plus_batch",
+    insertmanyvalues_page_size=1000
+)
 
 # Create SessionLocal class
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# Async engine for request handlers; the sync engine above stays for Celery
+# workers and the repository layer
+async_engine = create_async_engine(
+    make_url(settings.DATABASE_URL).set(drivername="postgresql+asyncpg"),
+    **POOL_OPTIONS,
+    query_cache_size=settings.DB_QUERY_CACHE_SIZE
+)
+
+AsyncSessionLocal = async_sessionmaker(
+    async_engine,
+    class_=AsyncSession,
+    autoflush=False,
+    expire_on_commit=False
+)
+
 # Create Base class for models
 Base = declarative_base()
 
@@ -18,4 +63,27 @@ def get_db():
     try:
         yield db
     finally:
-        db.close()
\ No newline at end of file
+        db.close()
+
+
+async def warm_connection_pool(size: int = settings.DB_POOL_SIZE) -> None:
+    """
+    Open ``size`` pooled request-handler connections up front so the first
+    requests after startup don't pay for the TCP/TLS handshake and
+    authentication. A no-op under NullPool, which keeps nothing open.
+    """
+    if settings.DB_EXTERNAL_POOLER:
+        return
+    # Connect concurrently so startup pays for one handshake, not ``size``
+    opened = await asyncio.gather(
+        *(async_engine.connect() for _ in range(size)), return_exceptions=True
+    )
+    connections = [conn for conn in opened if not isinstance(conn, BaseException)]
+    try:
+        for conn in opened:
+            if isinstance(conn, BaseException):
+                raise conn
+        await asyncio.gather(*(conn.execute(text("SELECT 1")) for conn in connections))
+    finally:
+        await asyncio.gather(*(conn.close() for conn in connections))
+    logger.info(f"Warmed database connection pool with {len(connections)} connections")
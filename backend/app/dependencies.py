@@ -4,10 +4,14 @@ Centralizes dependency management and follows Dependency Inversion Principle
 """
 import logging
 import os
-from typing import Optional, Generator
+from typing import Optional, AsyncGenerator, Awaitable, Callable, Type, TypeVar
 from functools import lru_cache
+from fastapi import Request
+from fastapi.exceptions import RequestValidationError
+from pydantic import BaseModel, ValidationError as PydanticValidationError
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
-from app.database import SessionLocal
+from app.database import SessionLocal, AsyncSessionLocal
 from app.repositories.job_repository import JobRepository
 from app.repositories.user_repository import UserRepository
 from app.services.auth.auth_service import Auth0Service
@@ -16,9 +20,13 @@ from app.services.job_search_service import JobSearchService
 from app.services.scrapers.scraper_factory import ScraperFactory
 from app.services.job_result_processor import JobResultProcessor
 from app.services.job_description_fetcher import JobDescriptionFetcher
+from app.services.job_parser import JobParser, job_parser
+from app.exceptions import AuthenticationError
 
 logger = logging.getLogger(__name__)
 
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
 
 class DependencyContainer:
     """
@@ -56,10 +64,37 @@ class DependencyContainer:
         self._result_processor: Optional[JobResultProcessor] = None
         self._description_fetcher: Optional[JobDescriptionFetcher] = None
         self._job_search_service: Optional[JobSearchService] = None
+        self._job_parser: Optional[JobParser] = None
 
         self._initialized = True
         logger.info("Dependency container initialized")
 
+    # Lifecycle
+
+    async def startup(self) -> None:
+        """
+        Warm shared services at application startup
+
+        Loads the Auth0 signing keys so the first authenticated request is a
+        key-map lookup, then schedules the periodic key refresh.
+        """
+        jwks_provider = self.get_jwks_provider()
+        try:
+            await jwks_provider.refresh()
+        except AuthenticationError as e:
+            logger.warning(f"JWKS warmup failed, keys will load on demand: {e.message}")
+        jwks_provider.start_background_refresh()
+
+    async def shutdown(self) -> None:
+        """Stop background work owned by shared services"""
+        if self._jwks_provider is not None:
+            await self._jwks_provider.stop_background_refresh()
+            await self._jwks_provider.aclose()
+        if self._job_parser is not None:
+            await self._job_parser.aclose()
+        if self._description_fetcher is not None:
+            await self._description_fetcher.aclose()
+
     # Database Dependencies
 
     def get_db(self) -> Session:
@@ -144,6 +179,18 @@ class DependencyContainer:
             logger.info("Job search service created with injected dependencies")
         return self._job_search_service
 
+    def get_job_parser(self) -> JobParser:
+        """
+        Get job posting parser (singleton)
+
+        Reuses the module-level parser so the spaCy model is loaded once per
+        process rather than once per consumer.
+        """
+        if self._job_parser is None:
+            self._job_parser = job_parser
+            logger.info("Job parser registered")
+        return self._job_parser
+
 
 # Global container instance
 container = DependencyContainer()
@@ -151,17 +198,43 @@ container = DependencyContainer()
 
 # FastAPI dependency functions
 
-def get_db() -> Generator:
+async def get_db() -> AsyncGenerator[AsyncSession, None]:
     """
-    FastAPI dependency for database session
+    FastAPI dependency for async database session
 
-    Yields database session and ensures it's closed after use
+    Yields database session, rolls back if the request fails and ensures it's
+    closed after use
     """
-    db = SessionLocal()
-    try:
-        yield db
-    finally:
-        db.close()
+    async with AsyncSessionLocal() as db:
+        try:
+            yield db
+        except Exception:
+            await db.rollback()
+            raise
+
+
+def json_body(model: Type[ModelT]) -> Callable[[Request], Awaitable[ModelT]]:
+    """
+    Build a request-body dependency that validates the raw JSON bytes
+
+    model_validate_json parses and validates in a single pydantic-core pass,
+    skipping the intermediate dict FastAPI builds with json.loads.
+
+    Args:
+        model: Pydantic model describing the body
+
+    Returns:
+        Dependency callable yielding a validated model instance
+    """
+    async def dependency(request: Request) -> ModelT:
+        try:
+            return model.model_validate_json(await request.body())
+        except PydanticValidationError as e:
+            raise RequestValidationError(
+                [{**error, "loc": ("body", *error["loc"])} for error in e.errors(include_url=False)]
+            )
+
+    return dependency
 
 
 async def get_current_user(token: str):
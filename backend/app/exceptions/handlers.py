@@ -0,0 +1,41 @@
+"""
+Global Exception Handlers
+
+Maps application and database exceptions to HTTP responses in one place so
+endpoints don't need their own try/except wrappers
+"""
+import logging
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse
+from sqlalchemy.exc import SQLAlchemyError
+from app.exceptions import ApplicationException
+
+logger = logging.getLogger(__name__)
+
+
+async def application_exception_handler(request: Request, exc: ApplicationException) -> JSONResponse:
+    """Return the status code and message carried by the exception"""
+    if exc.status_code >= 500:
+        logger.error(f"{request.method} {request.url.path} failed: {exc.message}")
+    return JSONResponse(status_code=exc.status_code, content={"detail": exc.message})
+
+
+async def database_exception_handler(request: Request, exc: SQLAlchemyError) -> JSONResponse:
+    """
+    Log database failures and return a generic 500
+
+    The session is rolled back by the get_db dependency as the error unwinds.
+    """
+    logger.error(f"{request.method} {request.url.path} database error: {str(exc)}", exc_info=exc)
+    return JSONResponse(status_code=500, content={"detail": "Database error"})
+
+
+def register_exception_handlers(app: FastAPI) -> None:
+    """
+    Register the global exception handlers
+
+    Args:
+        app: FastAPI application
+    """
+    app.add_exception_handler(ApplicationException, application_exception_handler)
+    app.add_exception_handler(SQLAlchemyError, database_exception_handler)
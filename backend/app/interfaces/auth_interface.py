@@ -3,7 +3,7 @@ Authentication Interface - Contract for authentication services
 Follows Interface Segregation Principle
 """
 from abc import ABC, abstractmethod
-from typing import Dict, Optional
+from typing import Any, Dict, Optional
 
 
 class IAuthService(ABC):
@@ -52,7 +52,7 @@ class IJWKSProvider(ABC):
     """
 
     @abstractmethod
-    async def get_public_key(self, kid: str) -> bytes:
+    async def get_public_key(self, kid: str) -> Any:
         """
         Get public key for token verification
 
@@ -60,10 +60,15 @@ class IJWKSProvider(ABC):
             kid: Key ID from token header
 
         Returns:
-            Public key in PEM format
+            Public key accepted by jwt.decode (key object or PEM)
         """
         pass
 
+    @abstractmethod
+    async def refresh(self) -> None:
+        """Re-fetch the key set and replace the cached keys"""
+        pass
+
     @abstractmethod
     def clear_cache(self) -> None:
         """Clear the JWKS cache"""
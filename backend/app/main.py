@@ -1,36 +1,59 @@
 import logging
+import queue
+from logging.handlers import QueueHandler, QueueListener
 import jwt
 import json
-import requests
+import time
 import uuid
-from fastapi import FastAPI, HTTPException, Depends, Request, BackgroundTasks, Query
+import hashlib
+import orjson
+from cachetools import TTLCache
+from collections import Counter
+from contextlib import asynccontextmanager
+from functools import lru_cache
+from fastapi import FastAPI, HTTPException, Depends, Request, Query
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse
 from fastapi.security import OAuth2PasswordBearer
-from app.database import SessionLocal, engine
+from app.database import AsyncSessionLocal, engine, async_engine, warm_connection_pool
+from app.cache import close_cache, get_cached, set_cached, invalidate, claim, etag_response
+from app.dependencies import container
+from app.exceptions.handlers import register_exception_handlers
+from app.middleware import RequestLoggingMiddleware
 from app.models import job, user, resume
 from app.services.job_parser import job_parser
-from app.services.job_scraper import JobSearchParams, job_scraper_service, job_scraper_background
-from app.tasks.job_scraper import scrape_jobs_task
-from sqlalchemy.orm import Session
-from sqlalchemy import desc, or_, func
-from pydantic import BaseModel, HttpUrl
+from app.services.job_scraper import JobSearchParams, job_scraper_service
+from app.tasks import app as celery_app
+from app.tasks.job_parser import parse_job_task
+from app.tasks.job_scraper import scrape_jobs_task, refresh_top_skills_task
+from celery.result import AsyncResult
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select, update, delete, desc, or_, func
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from pydantic import BaseModel, ConfigDict, HttpUrl
 from datetime import datetime
 from typing import List, Optional, Dict
 import os
+import re
 import base64
 import asyncio
-from cryptography.hazmat.primitives.asymmetric.rsa import RSAPublicNumbers
+import httpx
+from cryptography.hazmat.primitives.asymmetric.rsa import RSAPublicKey, RSAPublicNumbers
 from cryptography.hazmat.backends import default_backend
-from cryptography.hazmat.primitives import serialization
 
-# Enhanced logging configuration
+# Enhanced logging configuration: handlers only enqueue records, and a
+# listener thread owns the file/stream writes off the event loop
+log_queue = queue.Queue(-1)
+log_listener = QueueListener(
+    log_queue,
+    logging.FileHandler('app.log'),
+    logging.StreamHandler()
+)
 logging.basicConfig(
     level=logging.INFO,
     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler('app.log'),
-        logging.StreamHandler()
-    ]
+    handlers=[QueueHandler(log_queue)]
 )
 
 logger = logging.getLogger(__name__)
@@ -39,12 +62,17 @@ logger = logging.getLogger(__name__)
 class JobCreate(BaseModel):
     title: str
     company: str
-    description: Optional[str] = None
-    url: Optional[HttpUrl] = None
+    description: Optional[str] = ""
+    # Plain string: the job form posts "" when no URL is given
+    url: Optional[str] = ""
     status: str = "Applied"
-    notes: Optional[str] = None
+    notes: Optional[str] = ""
     location: Optional[str] = None
     salary_range: Optional[str] = None
+    # Owner details, used to create the user row on their first job
+    user_id: Optional[str] = None
+    user_email: Optional[str] = ""
+    user_name: Optional[str] = ""
 
 class JobUpdate(BaseModel):
     title: Optional[str] = None
@@ -54,6 +82,21 @@ class JobUpdate(BaseModel):
     status: Optional[str] = None
     notes: Optional[str] = None
 
+class JobRead(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    id: int
+    title: str
+    company: str
+    description: Optional[str] = None
+    url: Optional[str] = None
+    status: Optional[str] = None
+    date_applied: Optional[datetime] = None
+    notes: Optional[str] = None
+    location: Optional[str] = None
+    salary_range: Optional[str] = None
+    user_id: Optional[str] = None
+
 class URLRequest(BaseModel):
     url: str
 
@@ -65,7 +108,44 @@ class ScrapeRequest(BaseModel):
     hours_old: Optional[int] = None
     fetch_description: Optional[bool] = False
 
-app = FastAPI(title="Job Application Tracker API", version="2.0.0")
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    log_listener.start()
+    try:
+        await warm_connection_pool()
+    except Exception as e:
+        logger.warning(f"Could not warm database connection pool: {str(e)}")
+    await container.startup()
+    # Shared outbound HTTP/2 client so probes, JWKS fetches and other
+    # upstream calls reuse (and multiplex over) pooled connections
+    app.state.http = httpx.AsyncClient(
+        http2=True,
+        limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+        timeout=10.0
+    )
+    # Warm the JWKS so the first authenticated requests don't pay for it
+    try:
+        await fetch_jwks_once()
+    except Exception as e:
+        logger.warning(f"Could not prefetch JWKS: {str(e)}")
+    jwks_refresh = asyncio.create_task(refresh_jwks_periodically())
+    yield
+    jwks_refresh.cancel()
+    await app.state.http.aclose()
+    await container.shutdown()
+    await job_parser.aclose()
+    await close_cache()
+    await async_engine.dispose()
+    engine.dispose()
+    log_listener.stop()
+
+app = FastAPI(
+    title="Job Application Tracker API",
+    version="2.0.0",
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse
+)
+register_exception_handlers(app)
 
 # Environment configuration
 ALLOWED_ORIGINS = os.getenv("ALLOWED_ORIGINS", "http://localhost:3000").split(",")
@@ -81,6 +161,12 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Compress JSON list payloads; small bodies aren't worth the CPU
+app.add_middleware(GZipMiddleware, minimum_size=1024)
+
+# Request logging (pure ASGI, no BaseHTTPMiddleware wrapping)
+app.add_middleware(RequestLoggingMiddleware)
+
 # Authentication setup
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="token")
 
@@ -91,54 +177,126 @@ def ensure_bytes(key):
     return key
 
 def decode_value(val):
-    decoded = base64.urlsafe_b64decode(ensure_bytes(val + '=' * (4 - len(val) % 4)))
+    raw = ensure_bytes(val)
+    decoded = base64.urlsafe_b64decode(raw + b'=' * (-len(raw) % 4))
     return int.from_bytes(decoded, 'big')
 
-def get_public_key_from_jwk(jwk):
-    e = decode_value(jwk['e'])
-    n = decode_value(jwk['n'])
-    
-    numbers = RSAPublicNumbers(e=e, n=n)
-    key = numbers.public_key(backend=default_backend())
-    
-    pem = key.public_bytes(
-        encoding=serialization.Encoding.PEM,
-        format=serialization.PublicFormat.SubjectPublicKeyInfo
-    )
-    
-    return pem
+@lru_cache(maxsize=64)
+def public_key_from_numbers(e: int, n: int) -> RSAPublicKey:
+    # Memoized so refetches and kid churn don't rebuild the same key
+    return RSAPublicNumbers(e=e, n=n).public_key(backend=default_backend())
+
+def get_public_key_from_jwk(jwk) -> RSAPublicKey:
+    # jwt.decode accepts the key object directly, so skip the PEM round-trip
+    return public_key_from_numbers(decode_value(jwk['e']), decode_value(jwk['n']))
+
+def parse_jwks(jwks: Dict) -> Dict[str, RSAPublicKey]:
+    """Build the public key for every RSA signing key in a JWKS document"""
+    return {
+        key['kid']: get_public_key_from_jwk(key)
+        for key in jwks.get('keys', [])
+        if key.get('kty') == 'RSA' and 'kid' in key
+    }
 
-# Cache for JWKS
-JWKS_CACHE = {}
+# Cache for JWKS: kid -> public key. Bounded, so rotated-out kids expire
+# instead of accumulating; writes happen between awaits, so no lock is needed
+JWKS_CACHE_TTL_SECONDS = 24 * 60 * 60
+JWKS_CACHE: TTLCache = TTLCache(maxsize=32, ttl=JWKS_CACHE_TTL_SECONDS)
+# Unknown kids are remembered briefly so bad tokens can't stampede Auth0
+JWKS_NEGATIVE_TTL_SECONDS = 5 * 60
+JWKS_MISSING: TTLCache = TTLCache(maxsize=1024, ttl=JWKS_NEGATIVE_TTL_SECONDS)
+JWKS_FETCH_ATTEMPTS = 3
+JWKS_RETRY_BACKOFF_SECONDS = 0.2
+# The fetch currently in flight, shared by every concurrent miss
+_jwks_inflight: Optional[asyncio.Future] = None
+
+async def fetch_jwks() -> None:
+    """Fetch the JWKS once and cache every RSA signing key it contains"""
+    jwks_url = f'https://{AUTH0_DOMAIN}/.well-known/jwks.json'
+    for attempt in range(1, JWKS_FETCH_ATTEMPTS + 1):
+        try:
+            response = await app.state.http.get(jwks_url, timeout=5.0)
+            if response.status_code < 500 or attempt == JWKS_FETCH_ATTEMPTS:
+                break
+        except httpx.TransportError:
+            if attempt == JWKS_FETCH_ATTEMPTS:
+                raise
+        # Retry transient Auth0 failures with exponential backoff
+        await asyncio.sleep(JWKS_RETRY_BACKOFF_SECONDS * 2 ** (attempt - 1))
+    response.raise_for_status()
+    jwks = response.json()
+    
+    # Key construction is CPU-bound; keep it off the event loop
+    public_keys = await asyncio.to_thread(parse_jwks, jwks)
+    for kid, public_key in public_keys.items():
+        JWKS_CACHE[kid] = public_key
+        JWKS_MISSING.pop(kid, None)
+
+def _clear_jwks_inflight(_: asyncio.Future) -> None:
+    global _jwks_inflight
+    _jwks_inflight = None
+
+async def fetch_jwks_once() -> None:
+    """Singleflight: concurrent misses, for any kid, await one shared fetch"""
+    global _jwks_inflight
+    if _jwks_inflight is None:
+        _jwks_inflight = asyncio.ensure_future(fetch_jwks())
+        _jwks_inflight.add_done_callback(_clear_jwks_inflight)
+    # Shield so one cancelled request doesn't cancel the fetch for the rest
+    await asyncio.shield(_jwks_inflight)
+
+JWKS_REFRESH_INTERVAL_SECONDS = 60 * 60
+
+async def refresh_jwks_periodically() -> None:
+    """Refetch the JWKS hourly so rotated keys are cached before they're seen"""
+    while True:
+        await asyncio.sleep(JWKS_REFRESH_INTERVAL_SECONDS)
+        try:
+            await fetch_jwks_once()
+        except Exception as e:
+            logger.warning(f"Periodic JWKS refresh failed: {str(e)}")
 
 async def get_public_key(token):
     try:
         token_header = jwt.get_unverified_header(token)
         kid = token_header.get('kid')
         
-        if kid not in JWKS_CACHE:
-            logger.info(f"Fetching JWKS from Auth0 for kid: {kid}")
-            jwks_url = f'https://{AUTH0_DOMAIN}/.well-known/jwks.json'
-            jwks = requests.get(jwks_url).json()
-            
-            signing_key = None
-            for key in jwks['keys']:
-                if key['kid'] == kid:
-                    signing_key = key
-                    break
-            
-            if signing_key:
-                public_key = get_public_key_from_jwk(signing_key)
-                JWKS_CACHE[kid] = public_key
-            else:
-                raise HTTPException(status_code=401, detail="Unable to find appropriate key")
+        public_key = JWKS_CACHE.get(kid)
+        if public_key is not None:
+            return public_key
+        
+        if kid in JWKS_MISSING:
+            raise HTTPException(status_code=401, detail="Unable to find appropriate key")
         
-        return JWKS_CACHE[kid]
+        logger.info(f"Fetching JWKS from Auth0 for kid: {kid}")
+        await fetch_jwks_once()
+        public_key = JWKS_CACHE.get(kid)
+        if public_key is None:
+            JWKS_MISSING[kid] = True
+            raise HTTPException(status_code=401, detail="Unable to find appropriate key")
+        
+        return public_key
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Error getting public key: {str(e)}")
         raise HTTPException(status_code=401, detail="Invalid token")
 
+# Verified payloads keyed by token; entries are only served until the token's
+# own exp, and the TTL bounds how long any entry can stay
+TOKEN_CACHE_TTL_SECONDS = 300
+TOKEN_CACHE: TTLCache = TTLCache(maxsize=10_000, ttl=TOKEN_CACHE_TTL_SECONDS)
+
+def token_fingerprint(token: str) -> bytes:
+    """16-byte digest of a token, used as the cache key instead of the JWT"""
+    return hashlib.blake2b(token.encode(), digest_size=16).digest()
+
 async def verify_token(token: str = Depends(oauth2_scheme)):
+    cache_key = token_fingerprint(token)
+    cached = TOKEN_CACHE.get(cache_key)
+    if cached is not None and cached["exp"] > time.time():
+        return cached
+    
     try:
         logger.debug(f"Verifying token: {token[:10]}... (length: {len(token)})")
         logger.debug(f"Using AUTH0_DOMAIN: {AUTH0_DOMAIN}, AUTH0_API_AUDIENCE: {AUTH0_API_AUDIENCE}")
@@ -162,6 +320,9 @@ async def verify_token(token: str = Depends(oauth2_scheme)):
         
         logger.info("Token verified successfully")
         logger.debug(f"Token payload: {payload}")
+        # Only successful verifications are cached, never failures
+        if "exp" in payload:
+            TOKEN_CACHE[cache_key] = payload
         return payload
         
     except jwt.ExpiredSignatureError as e:
@@ -180,163 +341,296 @@ async def verify_token(token: str = Depends(oauth2_scheme)):
         logger.error(f"Token verification failed: Unexpected error - {str(e)}", exc_info=True)
         raise HTTPException(status_code=401, detail="Token verification failed")
 
-# Database dependency
+# Database dependencies
 async def get_db():
-    db = SessionLocal()
-    try:
-        yield db
-    finally:
-        db.close()
-
-# Create database tables
-job.Base.metadata.create_all(bind=engine)
-user.Base.metadata.create_all(bind=engine)
-resume.Base.metadata.create_all(bind=engine)
-
-# Request logging middleware
-@app.middleware("http")
-async def log_requests(request: Request, call_next):
-    logger.info(f"Request: {request.method} {request.url}")
-    response = await call_next(request)
-    logger.info(f"Response status: {response.status_code}")
-    return response
-
-@app.post("/api/jobs/")
-async def create_job(job_data: dict, db: Session = Depends(get_db)):
+    async with AsyncSessionLocal() as db:
+        try:
+            yield db
+        except Exception:
+            await db.rollback()
+            raise
+# Read responses are cached briefly in Redis and dropped on writes
+RESPONSE_CACHE_TTL_SECONDS = 30
+# mv_top_skills only changes when the view is refreshed, and the refresh task
+# drops these entries, so the TTL is only a backstop
+TOP_SKILLS_CACHE_TTL_SECONDS = 600
+# Job writes refresh mv_top_skills at most once per window, this long after
+# the first write
+TOP_SKILLS_REFRESH_DEBOUNCE_SECONDS = 30
+# Skills /api/jobs/top-skills reports; mv_top_skills tracks a longer list
+# for JobRepository.get_skills_statistics
+TOP_SKILLS_ENDPOINT_SKILLS = (
+    "python", "javascript", "java", "sql", "aws", "docker", "kubernetes",
+    "react", "node.js", "typescript", "git", "linux", "agile", "scrum",
+    "machine learning", "data analysis", "cloud computing", "devops"
+)
+
+def skip_duplicate_urls(stmt):
+    """Make a jobs INSERT skip rows whose (user_id, url) the user already has"""
+    return stmt.on_conflict_do_nothing(
+        index_elements=["user_id", "url"],
+        index_where=job.Job.url != ""
+    )
+
+def find_skipped_rows(rows: List[Dict], inserted) -> List[Dict]:
+    """
+    Match (id, url) rows returned by a skip_duplicate_urls INSERT back to the
+    submitted rows, since RETURNING only covers the ones actually inserted
+    """
+    inserted_urls = Counter(url for _, url in inserted)
+    skipped = []
+    for index, row in enumerate(rows):
+        if not row["url"]:
+            continue
+        if inserted_urls[row["url"]]:
+            inserted_urls[row["url"]] -= 1
+        else:
+            skipped.append({"index": index, "url": row["url"]})
+    return skipped
+
+async def schedule_top_skills_refresh() -> None:
+    """
+    Queue one mv_top_skills refresh per debounce window
+
+    The first write in a window claims it and queues the refresh to run when
+    the window closes, so it sees every write made meanwhile; later writes in
+    the window piggyback on it.
+    """
+    if await claim("refresh:top-skills", TOP_SKILLS_REFRESH_DEBOUNCE_SECONDS):
+        refresh_top_skills_task.apply_async(countdown=TOP_SKILLS_REFRESH_DEBOUNCE_SECONDS)
+
+async def invalidate_job_caches(user_id: Optional[str]) -> None:
+    patterns = ["jobs:all:*"]
+    if user_id:
+        patterns.append(f"scraped:{user_id}:*")
+    await invalidate(*patterns)
+    if user_id:
+        # mv_top_skills only counts owned jobs
+        await schedule_top_skills_refresh()
+
+@app.post("/api/jobs/", response_model=JobRead)
+async def create_job(job_data: JobCreate, db: AsyncSession = Depends(get_db)):
     try:
-        if user_id := job_data.get("user_id"):
-            existing_user = db.query(user.User).filter(user.User.id == user_id).first()
-            
-            if not existing_user:
-                new_user = user.User(
-                    id=user_id,
-                    email=job_data.get("user_email", ""),
-                    full_name=job_data.get("user_name", "")
-                )
-                db.add(new_user)
-                db.commit()
-                db.refresh(new_user)
+        if user_id := job_data.user_id:
+            # Create the owner on their first job; same transaction as the job
+            await db.execute(
+                pg_insert(user.User)
+                .values(id=user_id, email=job_data.user_email, full_name=job_data.user_name)
+                .on_conflict_do_nothing(index_elements=["id"])
+            )
         
-        db_job = job.Job(
-            title=job_data.get("title"),
-            company=job_data.get("company"),
-            description=job_data.get("description", ""),
-            url=job_data.get("url", ""),
-            status=job_data.get("status", "Applied"),
-            notes=job_data.get("notes", ""),
-            date_applied=datetime.utcnow(),
-            user_id=user_id if user_id else None
-        )
+        # A URL the user already tracks hits ix_jobs_user_url and inserts nothing
+        db_job = (await db.execute(
+            skip_duplicate_urls(pg_insert(job.Job).values(
+                **job_data.model_dump(exclude={"user_id", "user_email", "user_name"}),
+                user_id=user_id if user_id else None
+            )).returning(job.Job)
+        )).scalar_one_or_none()
+        if db_job is None:
+            await db.rollback()
+            raise HTTPException(status_code=409, detail="A job with this URL already exists")
         
-        db.add(db_job)
-        db.commit()
-        db.refresh(db_job)
+        await db.commit()
+        await invalidate_job_caches(db_job.user_id)
         return db_job
         
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Error creating job: {str(e)}")
-        db.rollback()
+        await db.rollback()
         raise HTTPException(status_code=500, detail=str(e))
 
-@app.get("/api/jobs/")
-async def get_jobs(db: Session = Depends(get_db)):
-    jobs = db.query(job.Job).all()
+MAX_JOBS_PER_BULK_CREATE = 500
+
+@app.post("/api/jobs/bulk", status_code=201)
+async def create_jobs_bulk(
+    jobs_data: List[JobCreate],
+    db: AsyncSession = Depends(get_db),
+    user_data: dict = Depends(verify_token)
+):
+    """Create a batch of jobs for the authenticated user in one transaction"""
+    if len(jobs_data) > MAX_JOBS_PER_BULK_CREATE:
+        raise HTTPException(
+            status_code=413,
+            detail=f"At most {MAX_JOBS_PER_BULK_CREATE} jobs can be created at once"
+        )
+    if not jobs_data:
+        return {"ids": [], "skipped": []}
     
-    result = []
-    for j in jobs:
-        job_data = {
-            "id": j.id,
-            "title": j.title,
-            "company": j.company,
-            "description": j.description,
-            "url": j.url,
-            "status": j.status,
-            "dateApplied": j.date_applied.isoformat() if j.date_applied else None,
-            "notes": j.notes
+    user_id = user_data.get("sub")
+    await db.execute(
+        pg_insert(user.User)
+        .values(id=user_id, email=user_data.get("email", ""), full_name=user_data.get("name", ""))
+        .on_conflict_do_nothing(index_elements=["id"])
+    )
+    # Every row has the same keys, so executemany batches them into multi-row
+    # INSERT ... RETURNING statements. date_applied is never sent, so each
+    # row gets the server default, as in create_job.
+    rows = [
+        {
+            **job_data.model_dump(exclude={"user_id", "user_email", "user_name"}),
+            "user_id": user_id
         }
-        result.append(job_data)
-        
-    return result
+        for job_data in jobs_data
+    ]
+    result = await db.execute(
+        skip_duplicate_urls(pg_insert(job.Job)).returning(job.Job.id, job.Job.url),
+        rows
+    )
+    inserted = result.all()
+    await db.commit()
+    
+    await invalidate_job_caches(user_id)
+    return {
+        "ids": [job_id for job_id, _ in inserted],
+        "skipped": find_skipped_rows(rows, inserted)
+    }
+
+# Only the columns the job list renders; rows come back as plain tuples
+JOB_LIST_COLUMNS = (
+    job.Job.id,
+    job.Job.title,
+    job.Job.company,
+    job.Job.description,
+    job.Job.url,
+    job.Job.status,
+    job.Job.date_applied,
+    job.Job.notes
+)
+
+def render_jobs(rows) -> bytes:
+    """Serialize JOB_LIST_COLUMNS rows as the job list's JSON array"""
+    # orjson serializes datetimes natively (ISO 8601)
+    return orjson.dumps([
+        {
+            "id": row.id,
+            "title": row.title,
+            "company": row.company,
+            "description": row.description,
+            "url": row.url,
+            "status": row.status,
+            "dateApplied": row.date_applied,
+            "notes": row.notes
+        }
+        for row in rows
+    ])
 
-@app.get("/api/jobs/{job_id}")
+@app.get("/api/jobs/")
+async def get_jobs(
+    request: Request,
+    status: Optional[str] = Query(None, description="Filter by application status"),
+    limit: int = Query(50, ge=1, le=200, description="Number of results to return"),
+    offset: int = Query(0, ge=0, description="Number of results to skip"),
+    db: AsyncSession = Depends(get_db)
+):
+    cache_key = f"jobs:all:{status}:{limit}:{offset}"
+    cached = await get_cached(cache_key)
+    if cached is not None:
+        return etag_response(request, cached)
+    
+    query = select(*JOB_LIST_COLUMNS)
+    if status is not None:
+        query = query.where(job.Job.status == status)
+    query = query.order_by(desc(job.Job.date_applied), job.Job.id).offset(offset).limit(limit)
+    
+    # A page is at most 200 rows, so it is built in full: that gives even a
+    # cache miss an ETag, and the same bytes are what gets cached
+    payload = render_jobs((await db.execute(query)).all())
+    await set_cached(cache_key, payload, RESPONSE_CACHE_TTL_SECONDS)
+    return etag_response(request, payload)
+
+@app.get("/api/jobs/{job_id}", response_model=JobRead)
 async def get_job(
     job_id: int, 
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     user_data: dict = Depends(verify_token)
 ):
-    db_job = db.query(job.Job).filter(
-        job.Job.id == job_id,
-        job.Job.user_id == user_data.get("sub")
-    ).first()
+    result = await db.execute(
+        select(job.Job).where(
+            job.Job.id == job_id,
+            job.Job.user_id == user_data.get("sub")
+        )
+    )
+    db_job = result.scalar_one_or_none()
     if not db_job:
         raise HTTPException(status_code=404, detail="Job not found")
     return db_job
 
-@app.put("/api/jobs/{job_id}")
+@app.put("/api/jobs/{job_id}", response_model=JobRead)
 async def update_job(
     job_id: int,
     job_data: JobUpdate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     user_data: dict = Depends(verify_token)
 ):
-    db_job = db.query(job.Job).filter(
-        job.Job.id == job_id,
-        job.Job.user_id == user_data.get("sub")
-    ).first()
-    if not db_job:
-        raise HTTPException(status_code=404, detail="Job not found")
+    values = job_data.model_dump(mode="json", exclude_unset=True)
+    ownership = (job.Job.id == job_id, job.Job.user_id == user_data.get("sub"))
     
-    for key, value in job_data.dict(exclude_unset=True).items():
-        setattr(db_job, key, value)
+    if values:
+        # Single UPDATE ... RETURNING instead of select, setattr, commit, refresh
+        result = await db.execute(
+            update(job.Job).where(*ownership).values(**values).returning(job.Job)
+        )
+        await db.commit()
+    else:
+        result = await db.execute(select(job.Job).where(*ownership))
     
-    try:
-        db.commit()
-        db.refresh(db_job)
-        return db_job
-    except Exception as e:
-        db.rollback()
-        logger.error(f"Error updating job: {str(e)}")
-        raise HTTPException(status_code=500, detail="Error updating job")
+    db_job = result.scalar_one_or_none()
+    if not db_job:
+        raise HTTPException(status_code=404, detail="Job not found")
+    if values:
+        await invalidate_job_caches(db_job.user_id)
+    return db_job
 
 @app.delete("/api/jobs/{job_id}")
-async def delete_job(job_id: int, db: Session = Depends(get_db)):
-    try:
-        logger.info(f"Attempting to delete job with ID: {job_id}")
-        
-        db_job = db.query(job.Job).filter(job.Job.id == job_id).first()
-        
-        if db_job:
-            logger.info(f"Found job to delete: {db_job.title} at {db_job.company}")
-        else:
-            logger.warning(f"No job found with ID: {job_id}")
-            raise HTTPException(status_code=404, detail=f"Job with ID {job_id} not found")
-        
-        db.delete(db_job)
-        db.commit()
-        
-        logger.info(f"Successfully deleted job with ID: {job_id}")
-        return {"message": "Job deleted successfully", "id": job_id}
-        
-    except Exception as e:
-        logger.error(f"Error deleting job {job_id}: {str(e)}")
-        db.rollback()
-        raise HTTPException(status_code=500, detail=f"Error deleting job: {str(e)}")
+async def delete_job(
+    job_id: int,
+    db: AsyncSession = Depends(get_db),
+    user_data: dict = Depends(verify_token)
+):
+    logger.info(f"Attempting to delete job with ID: {job_id}")
+    
+    # Single DELETE ... RETURNING instead of select then delete
+    result = await db.execute(
+        delete(job.Job)
+        .where(job.Job.id == job_id, job.Job.user_id == user_data.get("sub"))
+        .returning(job.Job.user_id)
+    )
+    deleted = result.first()
+    if deleted is None:
+        logger.warning(f"No job found with ID: {job_id}")
+        raise HTTPException(status_code=404, detail=f"Job with ID {job_id} not found")
+    
+    await db.commit()
+    await invalidate_job_caches(deleted.user_id)
+    
+    logger.info(f"Successfully deleted job with ID: {job_id}")
+    return {"message": "Job deleted successfully", "id": job_id}
 
-@app.post("/api/jobs/parse-url")
+@app.post("/api/jobs/parse-url", status_code=202)
 async def parse_job_url(
     request_data: URLRequest,
     user_data: dict = Depends(verify_token)
 ):
-    try:
-        logger.info(f"Starting to parse URL: {request_data.url}")
-        job_data = await job_parser.parse_job_posting(request_data.url)
-        return job_data
-    except ValueError as e:
-        logger.error(f"Error parsing job URL: {str(e)}")
-        raise HTTPException(status_code=400, detail=str(e))
-    except Exception as e:
-        logger.error(f"Unexpected error: {str(e)}")
-        raise HTTPException(status_code=500, detail="Internal server error")
+    """Queue a job posting URL for parsing; poll /api/tasks/{task_id} for the result"""
+    logger.info(f"Queueing URL for parsing: {request_data.url}")
+    task = parse_job_task.delay(request_data.url)
+    return {"task_id": task.id, "status": "processing"}
+
+def _read_task_result(task_id: str) -> Dict:
+    # Reading the result backend is blocking I/O; callers run this in a thread
+    result = AsyncResult(task_id, app=celery_app)
+    if result.successful():
+        return {"task_id": task_id, "state": result.state, "result": result.result}
+    if result.failed():
+        return {"task_id": task_id, "state": result.state, "error": str(result.result)}
+    return {"task_id": task_id, "state": result.state}
+
+@app.get("/api/tasks/{task_id}")
+async def get_task(task_id: str, user_data: dict = Depends(verify_token)):
+    """Get the state and result of a queued Celery task"""
+    return await asyncio.to_thread(_read_task_result, task_id)
 
 @app.get("/api/health")
 async def health_check():
@@ -353,18 +647,18 @@ async def get_current_user(token: str = Depends(oauth2_scheme)):
 @app.post("/api/jobs/scrape")
 async def scrape_jobs(
     request: ScrapeRequest,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     user_data: dict = Depends(verify_token)
 ):
     """Trigger job scraping for specified search terms"""
     try:
         task_ids = []
+        # Handle site_name parameter - it can be a single string or a list
+        site_name = request.sites
+        if isinstance(site_name, str):
+            site_name = [site_name]
+
         for search_term in request.search_terms:
-            # Handle site_name parameter - it can be a single string or a list
-            site_name = request.sites
-            if isinstance(site_name, str):
-                site_name = [site_name]
-            
             params = JobSearchParams(
                 search_term=search_term,
                 location=request.location,
@@ -379,7 +673,7 @@ async def scrape_jobs(
             logger.info(f"Starting job scraping task for: {search_term} on sites: {site_name}")
             
             # Convert params to dict for Celery
-            params_dict = params.dict()
+            params_dict = params.model_dump(mode="json")
             
             # Start the Celery task
             task = scrape_jobs_task.delay(str(uuid.uuid4()), params_dict)
@@ -397,63 +691,104 @@ async def scrape_jobs(
 @app.get("/api/jobs/scrape/{task_id}")
 async def get_scraped_jobs(task_id: str):
     """Get the results of a job scraping task"""
-    task_status = job_scraper_background.get_task_status(task_id)
+    task = await asyncio.to_thread(_read_task_result, task_id)
     
-    if task_status["status"] == "not_found":
-        raise HTTPException(status_code=404, detail="Task not found")
-        
-    return task_status
+    if task["state"] == "SUCCESS":
+        return task["result"]
+    if task["state"] == "FAILURE":
+        return {"status": "failed", "error": task["error"]}
+    return {"status": "processing"}
 
-@app.post("/api/jobs/add-scraped")
+MAX_SCRAPED_JOBS_PER_BULK_ADD = 500
+
+def scraped_job_values(job_data: dict, user_id: str) -> Dict:
+    """Map a scraped job payload onto Job columns (date_applied left to the caller)"""
+    return {
+        "title": job_data.get("title"),
+        "company": job_data.get("company"),
+        "description": job_data.get("description", job_data.get("detailed_description", "")),
+        "url": job_data.get("url", ""),
+        "status": "Bookmarked",
+        "notes": f"Source: {job_data.get('source', 'Job Board')}\nLocation: {job_data.get('location', 'Not specified')}",
+        "user_id": user_id,
+        "location": job_data.get("location", "")
+    }
+
+@app.post("/api/jobs/add-scraped", response_model=JobRead)
 async def add_scraped_job(
     job_data: dict,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     user_data: dict = Depends(verify_token)
 ):
     """Add a scraped job to the database"""
-    try:
-        user_id = user_data.get("sub")
-        existing_user = db.query(user.User).filter(user.User.id == user_id).first()
-        
-        if not existing_user:
-            new_user = user.User(
-                id=user_id,
-                email=user_data.get("email", ""),
-                full_name=user_data.get("name", "")
-            )
-            db.add(new_user)
-            db.commit()
-            db.refresh(new_user)
-        
-        db_job = job.Job(
-            title=job_data.get("title"),
-            company=job_data.get("company"),
-            description=job_data.get("description", job_data.get("detailed_description", "")),
-            url=job_data.get("url", ""),
-            status="Bookmarked",
-            notes=f"Source: {job_data.get('source', 'Job Board')}\nLocation: {job_data.get('location', 'Not specified')}",
-            date_applied=None,
-            user_id=user_id,
-            location=job_data.get("location", "")
+    user_id = user_data.get("sub")
+    await db.execute(
+        pg_insert(user.User)
+        .values(id=user_id, email=user_data.get("email", ""), full_name=user_data.get("name", ""))
+        .on_conflict_do_nothing(index_elements=["id"])
+    )
+    # INSERT ... RETURNING replaces add, commit, refresh; the explicit None
+    # binds NULL rather than the server default
+    values = scraped_job_values(job_data, user_id)
+    result = await db.execute(
+        skip_duplicate_urls(pg_insert(job.Job).values(**values, date_applied=None))
+        .returning(job.Job)
+    )
+    db_job = result.scalar_one_or_none()
+    if db_job is None:
+        # Already bookmarked: adding it again is a no-op
+        db_job = (await db.execute(
+            select(job.Job).where(job.Job.user_id == user_id, job.Job.url == values["url"])
+        )).scalar_one()
+    await db.commit()
+    
+    await invalidate_job_caches(user_id)
+    return db_job
+
+@app.post("/api/jobs/add-scraped/bulk")
+async def add_scraped_jobs_bulk(
+    jobs_data: List[dict],
+    db: AsyncSession = Depends(get_db),
+    user_data: dict = Depends(verify_token)
+):
+    """Add a batch of scraped jobs in one transaction"""
+    if len(jobs_data) > MAX_SCRAPED_JOBS_PER_BULK_ADD:
+        raise HTTPException(
+            status_code=413,
+            detail=f"At most {MAX_SCRAPED_JOBS_PER_BULK_ADD} jobs can be added at once"
         )
-        db.add(db_job)
-        db.commit()
-        db.refresh(db_job)
-        return db_job
-    except Exception as e:
-        logger.error(f"Error adding scraped job: {str(e)}")
-        db.rollback()
-        raise HTTPException(status_code=500, detail=str(e))
+    if not jobs_data:
+        return {"ids": [], "skipped": []}
+    
+    user_id = user_data.get("sub")
+    await db.execute(
+        pg_insert(user.User)
+        .values(id=user_id, email=user_data.get("email", ""), full_name=user_data.get("name", ""))
+        .on_conflict_do_nothing(index_elements=["id"])
+    )
+    # executemany: rows are batched into multi-row INSERT ... RETURNING
+    # statements. An explicit None binds NULL rather than the server default.
+    # URLs the user already has (or repeats within the batch) are skipped.
+    rows = [{**scraped_job_values(job_data, user_id), "date_applied": None} for job_data in jobs_data]
+    result = await db.execute(
+        skip_duplicate_urls(pg_insert(job.Job)).returning(job.Job.id, job.Job.url),
+        rows
+    )
+    inserted = result.all()
+    await db.commit()
+    
+    await invalidate_job_caches(user_id)
+    return {
+        "ids": [job_id for job_id, _ in inserted],
+        "skipped": find_skipped_rows(rows, inserted)
+    }
 
 @app.post("/api/jobs/advanced-search")
 async def advanced_search(
     params: dict,
-    background_tasks: BackgroundTasks,
     user_data: dict = Depends(verify_token)
 ):
     """Enhanced job search with multiple parameters"""
-    task_id = str(uuid.uuid4())
-    
     search_params = JobSearchParams(
         search_term=params.get("search_term", ""),
         location=params.get("location", "Australia"),
@@ -467,36 +802,60 @@ async def advanced_search(
     
     logger.info(f"Received advanced job search request: {search_params.search_term}")
     
-    background_tasks.add_task(
-        job_scraper_background.start_job_search,
-        task_id=task_id,
-        params=search_params
-    )
+    # Run on a Celery worker rather than in-process alongside request handlers
+    task = scrape_jobs_task.delay(str(uuid.uuid4()), search_params.model_dump(mode="json"))
     
     return {
-        "task_id": task_id,
+        "task_id": task.id,
         "status": "processing",
         "message": f"Started advanced job search for '{search_params.search_term}'"
     }
 
+def encode_cursor(date_applied: Optional[datetime], job_id: int) -> str:
+    """Encode the (date_applied, id) sort key of the last row as an opaque cursor"""
+    last_date = date_applied.isoformat() if date_applied else None
+    return base64.urlsafe_b64encode(orjson.dumps([last_date, job_id])).decode()
+
+def decode_cursor(cursor: str):
+    """Decode a cursor produced by encode_cursor back into (date_applied, id)"""
+    try:
+        last_date, last_id = orjson.loads(base64.urlsafe_b64decode(cursor.encode()))
+        return (datetime.fromisoformat(last_date) if last_date else None), int(last_id)
+    except (ValueError, TypeError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
 @app.get("/api/jobs/scraped")
 async def get_scraped_jobs(
+    request: Request,
     search_query: Optional[str] = Query(None, description="Filter by job title, company, or description"),
     min_relevance: Optional[float] = Query(None, ge=0, le=1, description="Minimum relevance score (0-1)"),
     skills: Optional[str] = Query(None, description="Comma-separated list of required skills"),
     applied: Optional[bool] = Query(None, description="Filter by application status"),
     limit: int = Query(50, ge=1, le=100, description="Number of results to return"),
-    offset: int = Query(0, ge=0, description="Number of results to skip"),
-    db: Session = Depends(get_db),
+    cursor: Optional[str] = Query(None, description="Cursor returned as next_cursor by the previous page"),
+    include_total: bool = Query(False, description="Also count every matching job"),
+    db: AsyncSession = Depends(get_db),
     user_data: dict = Depends(verify_token)
 ):
     """Get scraped jobs with filtering options"""
+    keyset = decode_cursor(cursor) if cursor else None
     try:
         user_id = user_data.get("sub")
-        query = db.query(job.Job).filter(job.Job.user_id == user_id)
+        cache_key = f"scraped:{user_id}:{search_query}:{min_relevance}:{skills}:{applied}:{limit}:{cursor}:{include_total}"
+        cached = await get_cached(cache_key)
+        if cached is not None:
+            return etag_response(request, cached)
+        
+        skills_list = [s.strip().lower() for s in skills.split(',') if s.strip()] if skills else []
+        # Longest first so a skill isn't shadowed by a shorter prefix (java/javascript)
+        skill_matcher = re.compile(
+            "|".join(map(re.escape, sorted(skills_list, key=len, reverse=True)))
+        ) if skills_list else None
+
+        query = select(job.Job).where(job.Job.user_id == user_id)
         
         if applied is not None:
-            query = query.filter(job.Job.status == ("Applied" if applied else "Bookmarked"))
+            query = query.where(job.Job.status == ("Applied" if applied else "Bookmarked"))
         
         if search_query:
             search_filter = or_(
@@ -504,25 +863,52 @@ async def get_scraped_jobs(
                 job.Job.company.ilike(f"%{search_query}%"),
                 job.Job.description.ilike(f"%{search_query}%")
             )
-            query = query.filter(search_filter)
+            query = query.where(search_filter)
         
-        if skills:
-            skills_list = [s.strip().lower() for s in skills.split(',')]
-            for skill in skills_list:
-                query = query.filter(job.Job.description.ilike(f"%{skill}%"))
+        if skills_list:
+            # plainto_tsquery ANDs the words and parses them like the stored
+            # vector, so every skill is matched by one GIN-indexed predicate
+            query = query.where(job.Job.description_tsv.op("@@")(
+                func.plainto_tsquery("english", " ".join(skills_list))
+            ))
         
-        total = query.count()
-        jobs = query.order_by(desc(job.Job.date_applied)).offset(offset).limit(limit).all()
+        # Counting re-evaluates every filter over the whole match set, so only
+        # pay for it when the caller asks
+        total = None
+        if include_total:
+            total = await db.scalar(select(func.count()).select_from(query.subquery()))
+
+        # Seek past the previous page instead of OFFSET. DESC puts NULL dates
+        # first in Postgres, so a NULL cursor continues through the NULLs and
+        # then into every dated row.
+        if keyset is not None:
+            last_date, last_id = keyset
+            if last_date is None:
+                query = query.where(or_(
+                    job.Job.date_applied.is_not(None),
+                    job.Job.id < last_id
+                ))
+            else:
+                query = query.where(or_(
+                    job.Job.date_applied < last_date,
+                    (job.Job.date_applied == last_date) & (job.Job.id < last_id)
+                ))
+
+        result = await db.execute(
+            query.order_by(desc(job.Job.date_applied), desc(job.Job.id)).limit(limit + 1)
+        )
+        jobs = result.scalars().all()
+        next_cursor = None
+        if len(jobs) > limit:
+            jobs = jobs[:limit]
+            next_cursor = encode_cursor(jobs[-1].date_applied, jobs[-1].id)
         
         results = []
         for job_item in jobs:
-            skills_list = []
-            if job_item.description and skills:
-                for skill in skills_list:
-                    if skill.lower() in job_item.description.lower():
-                        skills_list.append(skill)
-            
-            date_applied = job_item.date_applied.isoformat() if job_item.date_applied else None
+            matched_skills = []
+            if skill_matcher and job_item.description:
+                found = set(skill_matcher.findall(job_item.description.lower()))
+                matched_skills = [skill for skill in skills_list if skill in found]
             
             job_details = {
                 "id": job_item.id,
@@ -532,10 +918,10 @@ async def get_scraped_jobs(
                 "url": job_item.url,
                 "status": job_item.status,
                 "location": job_item.location,
-                "skills": skills_list,
+                "skills": matched_skills,
                 "job_type": None,  # Not stored in DB, can be extracted from description if needed
                 "salary_range": job_item.salary_range,
-                "date_applied": date_applied,
+                "date_applied": job_item.date_applied,  # orjson emits ISO 8601
                 "date_scraped": None,  # Not stored in DB, can be added as a field if needed
                 "relevance_score": 1.0 if min_relevance is None else min_relevance,  # Placeholder
                 "search_query": search_query,
@@ -543,45 +929,54 @@ async def get_scraped_jobs(
             }
             results.append(job_details)
         
-        return {
+        payload = orjson.dumps({
             "jobs": results,
             "total": total,
             "limit": limit,
-            "offset": offset
-        }
+            "next_cursor": next_cursor
+        })
+        await set_cached(cache_key, payload, RESPONSE_CACHE_TTL_SECONDS)
+        return etag_response(request, payload)
     except Exception as e:
         logger.error(f"Error getting scraped jobs: {str(e)}")
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.get("/api/jobs/top-skills")
 async def get_top_skills(
+    request: Request,
     limit: int = Query(20, ge=1, le=100, description="Number of skills to return"),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     user_data: dict = Depends(verify_token)
 ):
-    """Get the top skills from all scraped jobs"""
+    """
+    Get the top skills across the user's jobs
+
+    Counts come from mv_top_skills, refreshed about 30 seconds after a job is
+    added, changed or deleted (and every 15 minutes), so they can trail
+    writes by that long.
+    """
     try:
         user_id = user_data.get("sub")
-        # Common skills to look for (can be expanded based on your needs)
-        common_skills = [
-            "python", "javascript", "java", "sql", "aws", "docker", "kubernetes",
-            "react", "node.js", "typescript", "git", "linux", "agile", "scrum",
-            "machine learning", "data analysis", "cloud computing", "devops"
-        ]
-        
-        # Count occurrences of each skill in job descriptions
-        skill_counts = []
-        for skill in common_skills:
-            count = db.query(job.Job).filter(
-                job.Job.user_id == user_id,
-                job.Job.description.ilike(f"%{skill}%")
-            ).count()
-            if count > 0:
-                skill_counts.append({"skill": skill, "count": count})
+        cache_key = f"skills:{user_id}:{limit}"
+        cached = await get_cached(cache_key)
+        if cached is not None:
+            return etag_response(request, cached)
         
-        # Sort by count and limit results
-        skill_counts.sort(key=lambda x: x["count"], reverse=True)
-        return {"skills": skill_counts[:limit]}
+        # Counts come precomputed from mv_top_skills
+        result = await db.execute(
+            select(job.top_skills_view.c.skill, job.top_skills_view.c.job_count)
+            .where(
+                job.top_skills_view.c.user_id == user_id,
+                job.top_skills_view.c.skill.in_(TOP_SKILLS_ENDPOINT_SKILLS)
+            )
+            .order_by(desc(job.top_skills_view.c.job_count), job.top_skills_view.c.skill)
+            .limit(limit)
+        )
+        payload = orjson.dumps(
+            {"skills": [{"skill": skill, "count": count} for skill, count in result.all()]}
+        )
+        await set_cached(cache_key, payload, TOP_SKILLS_CACHE_TTL_SECONDS)
+        return etag_response(request, payload)
     except Exception as e:
         logger.error(f"Error getting top skills: {str(e)}")
-        raise HTTPException(status_code=500, detail=str(e))
\ No newline at end of file
+        raise HTTPException(status_code=500, detail=str(e))
@@ -0,0 +1,37 @@
+"""
+ASGI Middleware
+
+Pure ASGI middleware, so requests don't pay for the extra task and body
+wrapping that @app.middleware("http") (BaseHTTPMiddleware) adds
+"""
+import logging
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+logger = logging.getLogger(__name__)
+
+
+class RequestLoggingMiddleware:
+    """Log each HTTP request line (and its response status at DEBUG)"""
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or not logger.isEnabledFor(logging.INFO):
+            await self.app(scope, receive, send)
+            return
+
+        query_string = scope.get("query_string", b"")
+        path = scope["path"] + (f"?{query_string.decode('latin-1')}" if query_string else "")
+        logger.info("Request: %s %s", scope["method"], path)
+
+        if not logger.isEnabledFor(logging.DEBUG):
+            await self.app(scope, receive, send)
+            return
+
+        async def send_with_logging(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                logger.debug("Response status: %s", message["status"])
+            await send(message)
+
+        await self.app(scope, receive, send_with_logging)
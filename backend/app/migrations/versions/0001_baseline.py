@@ -0,0 +1,84 @@
+"""baseline schema
+
+Revision ID: 0001_baseline
+Revises: 
+Create Date: 2025-11-28 00:00:00
+
+Captures the tables previously created by Base.metadata.create_all. Each
+table is only created when missing so existing databases can be stamped
+forward without recreating anything.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0001_baseline'
+down_revision: Union[str, None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    inspector = sa.inspect(op.get_bind())
+
+    if not inspector.has_table('users'):
+        op.create_table(
+            'users',
+            sa.Column('id', sa.String(length=255), primary_key=True),
+            sa.Column('email', sa.String(), nullable=False),
+            sa.Column('full_name', sa.String(), nullable=False),
+            sa.Column('created_at', sa.DateTime(), nullable=True),
+            sa.Column('last_login', sa.DateTime(), nullable=True),
+        )
+        op.create_index('ix_users_email', 'users', ['email'], unique=True)
+
+    if not inspector.has_table('resumes'):
+        op.create_table(
+            'resumes',
+            sa.Column('id', sa.Integer(), primary_key=True),
+            sa.Column('title', sa.String(), nullable=False),
+            sa.Column('file_path', sa.String(), nullable=False),
+            sa.Column('file_type', sa.String(), nullable=False),
+            sa.Column('uploaded_at', sa.DateTime(), nullable=True),
+            sa.Column('last_modified', sa.DateTime(), nullable=True),
+            sa.Column('is_active', sa.Boolean(), nullable=True),
+            sa.Column('version', sa.Integer(), nullable=True),
+            sa.Column('description', sa.Text(), nullable=True),
+            sa.Column('tags', sa.String(), nullable=True),
+            sa.Column('user_id', sa.String(), sa.ForeignKey('users.id'), nullable=False),
+        )
+        op.create_index('ix_resumes_id', 'resumes', ['id'])
+
+    if not inspector.has_table('jobs'):
+        op.create_table(
+            'jobs',
+            sa.Column('id', sa.Integer(), primary_key=True),
+            sa.Column('title', sa.String(length=255), nullable=False),
+            sa.Column('company', sa.String(length=255), nullable=False),
+            sa.Column('description', sa.Text(), nullable=True),
+            sa.Column('url', sa.String(length=512), nullable=True),
+            sa.Column('status', sa.String(length=50), nullable=True),
+            sa.Column('date_applied', sa.DateTime(), nullable=True),
+            sa.Column('last_updated', sa.DateTime(), nullable=True),
+            sa.Column('notes', sa.Text(), nullable=True),
+            sa.Column('location', sa.String(length=255), nullable=True),
+            sa.Column('salary_range', sa.String(length=100), nullable=True),
+            sa.Column('user_id', sa.String(length=255), sa.ForeignKey('users.id'), nullable=True),
+            sa.Column('resume_id', sa.Integer(), sa.ForeignKey('resumes.id'), nullable=True),
+            sa.Column('date_scraped', sa.DateTime(), nullable=True),
+            sa.Column('is_scraped', sa.Boolean(), nullable=True),
+            sa.Column('skills', sa.String(), nullable=True),
+            sa.Column('job_type', sa.String(), nullable=True),
+            sa.Column('search_query', sa.String(), nullable=True),
+            sa.Column('relevance_score', sa.Float(), nullable=True),
+        )
+        op.create_index('ix_jobs_id', 'jobs', ['id'])
+
+
+def downgrade() -> None:
+    op.drop_table('jobs')
+    op.drop_table('resumes')
+    op.drop_table('users')
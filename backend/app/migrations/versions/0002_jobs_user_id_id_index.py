@@ -0,0 +1,28 @@
+"""add composite (user_id, id) index on jobs
+
+Revision ID: 0002_jobs_user_id_id
+Revises: 0001_baseline
+Create Date: 2025-11-28 00:10:00
+
+Serves the per-user single-row lookups (WHERE user_id = ? AND id = ?) used
+by the job update/delete paths.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0002_jobs_user_id_id'
+down_revision: Union[str, None] = '0001_baseline'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute("CREATE INDEX IF NOT EXISTS ix_jobs_user_id_id ON jobs (user_id, id)")
+
+
+def downgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS ix_jobs_user_id_id")
@@ -0,0 +1,31 @@
+"""add trigram indexes for job title/company search
+
+Revision ID: 0003_jobs_trigram_search
+Revises: 0002_jobs_user_id_id
+Create Date: 2025-11-28 00:20:00
+
+Lets the ILIKE '%term%' search filters use a GIN index instead of a
+sequential scan.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0003_jobs_trigram_search'
+down_revision: Union[str, None] = '0002_jobs_user_id_id'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.execute("CREATE INDEX IF NOT EXISTS ix_jobs_title_trgm ON jobs USING gin (title gin_trgm_ops)")
+    op.execute("CREATE INDEX IF NOT EXISTS ix_jobs_company_trgm ON jobs USING gin (company gin_trgm_ops)")
+
+
+def downgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS ix_jobs_company_trgm")
+    op.execute("DROP INDEX IF EXISTS ix_jobs_title_trgm")
@@ -0,0 +1,31 @@
+"""add composite index for job status filters sorted by date
+
+Revision ID: 0004_jobs_user_status_date
+Revises: 0003_jobs_trigram_search
+Create Date: 2025-11-28 00:30:00
+
+Serves the user/status filter with newest-first ordering from the index
+instead of a sequential scan plus sort.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0004_jobs_user_status_date'
+down_revision: Union[str, None] = '0003_jobs_trigram_search'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS ix_jobs_user_status_date "
+        "ON jobs (user_id, status, date_applied DESC)"
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS ix_jobs_user_status_date")
@@ -0,0 +1,29 @@
+"""add trigram index for job description search
+
+Revision ID: 0005_jobs_description_trgm
+Revises: 0004_jobs_user_status_date
+Create Date: 2025-11-28 00:40:00
+
+Covers the description ILIKE '%term%' filters used by the search and skills
+queries, which were still sequential scans after 0003.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0005_jobs_description_trgm'
+down_revision: Union[str, None] = '0004_jobs_user_status_date'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.execute("CREATE INDEX IF NOT EXISTS ix_jobs_description_trgm ON jobs USING gin (description gin_trgm_ops)")
+
+
+def downgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS ix_jobs_description_trgm")
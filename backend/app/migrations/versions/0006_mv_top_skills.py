@@ -0,0 +1,49 @@
+"""add mv_top_skills materialized view
+
+Revision ID: 0006_mv_top_skills
+Revises: 0005_jobs_description_trgm
+Create Date: 2025-11-28 00:50:00
+
+Precomputes per-user skill counts over job descriptions so the top-skills
+endpoints read a few indexed rows instead of running one ILIKE count per
+skill. The unique index allows REFRESH MATERIALIZED VIEW CONCURRENTLY.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0006_mv_top_skills'
+down_revision: Union[str, None] = '0005_jobs_description_trgm'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+SKILLS = [
+    "python", "javascript", "java", "sql", "aws", "docker", "kubernetes",
+    "react", "node.js", "typescript", "git", "linux", "agile", "scrum",
+    "machine learning", "data analysis", "cloud computing", "devops",
+    "go", "rust", "c++", "c#", "ruby", "php", "swift", "kotlin",
+    "angular", "vue.js", "django", "flask", "spring", "microservices",
+    "postgresql", "mongodb", "redis", "elasticsearch", "kafka",
+    "terraform", "ansible", "jenkins", "ci/cd", "restful api", "graphql"
+]
+
+
+def upgrade() -> None:
+    skills = ", ".join(f"('{skill}')" for skill in SKILLS)
+    op.execute(f"""
+        CREATE MATERIALIZED VIEW IF NOT EXISTS mv_top_skills AS
+        SELECT j.user_id, s.skill, count(*) AS job_count
+        FROM jobs j
+        JOIN (VALUES {skills}) AS s(skill)
+            ON j.description ILIKE '%' || s.skill || '%'
+        WHERE j.user_id IS NOT NULL
+        GROUP BY j.user_id, s.skill
+    """)
+    op.execute("CREATE UNIQUE INDEX IF NOT EXISTS ux_mv_top_skills_user_skill ON mv_top_skills (user_id, skill)")
+
+
+def downgrade() -> None:
+    op.execute("DROP MATERIALIZED VIEW IF EXISTS mv_top_skills")
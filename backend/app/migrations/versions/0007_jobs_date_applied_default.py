@@ -0,0 +1,32 @@
+"""default jobs.date_applied to the insert time
+
+Revision ID: 0007_date_applied_default
+Revises: 0006_mv_top_skills
+Create Date: 2025-11-28 01:00:00
+
+Lets Postgres fill date_applied (as naive UTC, matching existing rows)
+instead of the application sending datetime.utcnow() with each insert.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0007_date_applied_default'
+down_revision: Union[str, None] = '0006_mv_top_skills'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.alter_column(
+        'jobs',
+        'date_applied',
+        server_default=sa.text("timezone('utc', now())")
+    )
+
+
+def downgrade() -> None:
+    op.alter_column('jobs', 'date_applied', server_default=None)
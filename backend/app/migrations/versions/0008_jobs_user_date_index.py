@@ -0,0 +1,34 @@
+"""add (user_id, date_applied DESC) index on jobs
+
+Revision ID: 0008_jobs_user_date
+Revises: 0007_date_applied_default
+Create Date: 2025-11-28 01:10:00
+
+Serves the scraped-jobs listing when no status filter is given: a per-user
+range scan already in date order, so OFFSET/LIMIT pages without a sort.
+Built CONCURRENTLY so the jobs table stays writable during the build.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0008_jobs_user_date'
+down_revision: Union[str, None] = '0007_date_applied_default'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_jobs_user_date "
+            "ON jobs (user_id, date_applied DESC)"
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_jobs_user_date")
@@ -0,0 +1,40 @@
+"""add generated description_tsv column with GIN index on jobs
+
+Revision ID: 0009_jobs_description_tsv
+Revises: 0008_jobs_user_date
+Create Date: 2025-11-28 01:30:00
+
+Lets the scraped-jobs skills filter match every requested skill with one
+full-text predicate served by a single GIN probe, instead of one
+ILIKE '%skill%' per skill. The column is STORED, so adding it rewrites the
+table once; the index is then built CONCURRENTLY.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0009_jobs_description_tsv'
+down_revision: Union[str, None] = '0008_jobs_user_date'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute(
+        "ALTER TABLE jobs ADD COLUMN IF NOT EXISTS description_tsv tsvector "
+        "GENERATED ALWAYS AS (to_tsvector('english', coalesce(description, ''))) STORED"
+    )
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_jobs_description_tsv "
+            "ON jobs USING gin (description_tsv)"
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_jobs_description_tsv")
+    op.execute("ALTER TABLE jobs DROP COLUMN IF EXISTS description_tsv")
@@ -0,0 +1,61 @@
+"""add unique (user_id, url) index on jobs
+
+Revision ID: 0010_jobs_user_url
+Revises: 0009_jobs_description_tsv
+Create Date: 2025-11-28 01:50:00
+
+Serves JobRepository.get_by_url and lets bulk_create skip jobs the user
+already has with INSERT ... ON CONFLICT DO NOTHING. Scraped jobs without a
+link are stored with an empty url, so those rows are left out of the index.
+The index cannot be built over existing duplicates, and those rows are
+user data, so the upgrade refuses to run while any remain and lists the
+conflicting (user_id, url) groups to resolve by hand.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0010_jobs_user_url'
+down_revision: Union[str, None] = '0009_jobs_description_tsv'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Duplicate groups shown in the error; the total is always reported
+MAX_REPORTED_DUPLICATES = 50
+
+
+def upgrade() -> None:
+    duplicates = op.get_bind().execute(sa.text(
+        "SELECT user_id, url, array_agg(id ORDER BY id) AS ids "
+        "FROM jobs WHERE url <> '' "
+        "GROUP BY user_id, url HAVING count(*) > 1 "
+        "ORDER BY user_id, url"
+    )).all()
+    if duplicates:
+        listed = "\n".join(
+            f"  user_id={user_id!r} url={url!r} job ids={list(ids)}"
+            for user_id, url, ids in duplicates[:MAX_REPORTED_DUPLICATES]
+        )
+        more = len(duplicates) - MAX_REPORTED_DUPLICATES
+        if more > 0:
+            listed += f"\n  ... and {more} more"
+        raise RuntimeError(
+            f"Cannot create unique index ix_jobs_user_url: {len(duplicates)} "
+            f"(user_id, url) group(s) have more than one job. Merge or delete "
+            f"the duplicates, then rerun the migration:\n{listed}"
+        )
+
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE UNIQUE INDEX CONCURRENTLY IF NOT EXISTS ix_jobs_user_url "
+            "ON jobs (user_id, url) WHERE url <> ''"
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_jobs_user_url")
@@ -14,21 +14,40 @@ class JobStatus(str, enum.Enum):
 
 
 # backend/app/models/job.py
-from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Text, Boolean, Float
-from sqlalchemy.orm import relationship
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Text, Boolean, Float, Index, Computed, desc, table, column, text, func
+from sqlalchemy.dialects.postgresql import TSVECTOR
+from sqlalchemy.orm import relationship, deferred
 from datetime import datetime
 from app.database import Base
 
 class Job(Base):
     __tablename__ = "jobs"
+    __table_args__ = (
+        Index("ix_jobs_user_id_id", "user_id", "id"),
+        Index("ix_jobs_user_status_date", "user_id", "status", desc("date_applied")),
+        Index("ix_jobs_user_date", "user_id", desc("date_applied")),
+        Index("ix_jobs_user_url", "user_id", "url", unique=True, postgresql_where=text("url <> ''")),
+        Index("ix_jobs_title_trgm", "title", postgresql_using="gin", postgresql_ops={"title": "gin_trgm_ops"}),
+        Index("ix_jobs_company_trgm", "company", postgresql_using="gin", postgresql_ops={"company": "gin_trgm_ops"}),
+        Index("ix_jobs_description_trgm", "description", postgresql_using="gin", postgresql_ops={"description": "gin_trgm_ops"}),
+        Index("ix_jobs_description_tsv", "description_tsv", postgresql_using="gin"),
+    )
     
     id = Column(Integer, primary_key=True, index=True)
     title = Column(String(255), nullable=False)
     company = Column(String(255), nullable=False)
     description = Column(Text, nullable=True)
+    # Maintained by Postgres for full-text skill matching (see migration 0009);
+    # deferred so loading a Job doesn't pull the vector
+    description_tsv = deferred(Column(
+        TSVECTOR,
+        Computed("to_tsvector('english', coalesce(description, ''))", persisted=True)
+    ))
     url = Column(String(512), nullable=True)
     status = Column(String(50), default="Applied")  # Added 'Scraped' as a possible status
-    date_applied = Column(DateTime, nullable=True)  # Nullable for scraped jobs
+    # Filled by Postgres on insert (naive UTC, like the other timestamps);
+    # scraped jobs insert an explicit NULL
+    date_applied = Column(DateTime, nullable=True, server_default=func.timezone("utc", func.now()))
     last_updated = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
     notes = Column(Text, nullable=True)
     location = Column(String(255), nullable=True)
@@ -44,6 +63,21 @@ class Job(Base):
     search_query = Column(String, nullable=True)  # The search term used to find this job
     relevance_score = Column(Float, default=0.0)  # Score indicating relevance to search query
     
-    # Define the relationships
-    user = relationship("User", back_populates="jobs")
-    resume = relationship("Resume", back_populates="jobs")
\ No newline at end of file
+    # Define the relationships. Nothing serializes these off a Job, so an
+    # accidental lazy load (an N+1 over a job list) raises instead of
+    # silently querying per row; use selectinload() where one is needed.
+    user = relationship("User", back_populates="jobs", lazy="raise")
+    resume = relationship("Resume", back_populates="jobs", lazy="raise")
+
+# Per-user skill counts precomputed by the mv_top_skills materialized view
+# (see migration 0006). Kept off Base.metadata so autogenerate ignores it.
+top_skills_view = table(
+    "mv_top_skills",
+    column("user_id"),
+    column("skill"),
+    column("job_count"),
+)
+
+
+# Recompute the view without blocking readers (needs its unique index)
+REFRESH_TOP_SKILLS = text("REFRESH MATERIALIZED VIEW CONCURRENTLY mv_top_skills")
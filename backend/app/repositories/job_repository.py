@@ -4,18 +4,23 @@ Implements Repository Pattern for Job entity data access
 """
 from typing import List, Optional, Dict, Any
 from sqlalchemy.orm import Session
-from sqlalchemy import desc, or_, func
-from app.interfaces.repository_interface import IJobRepository
-from app.models.job import Job
+from sqlalchemy import desc, or_, func, select, update, delete
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from app.models.job import Job, top_skills_view
 from app.exceptions import EntityNotFoundError, DatabaseError
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Columns update() may write; generated columns are maintained by Postgres
+UPDATABLE_COLUMNS = frozenset(
+    c.key for c in Job.__table__.columns if c.computed is None and not c.primary_key
+)
 
-class JobRepository(IJobRepository):
+
+class JobRepository:
     """
-    Concrete implementation of Job Repository
+    Concrete implementation of Job Repository (satisfies IJobRepository)
 
     Handles all database operations for Job entities
     Follows Single Responsibility Principle - only concerned with data access
@@ -41,7 +46,8 @@ class JobRepository(IJobRepository):
             Job object or None if not found
         """
         try:
-            return self.db.query(Job).filter(Job.id == entity_id).first()
+            # Identity map first, then the mapper's cached primary-key loader
+            return self.db.get(Job, entity_id)
         except Exception as e:
             logger.error(f"Error getting job by ID {entity_id}: {str(e)}")
             raise DatabaseError(f"Failed to retrieve job: {str(e)}")
@@ -121,18 +127,21 @@ class JobRepository(IJobRepository):
         Returns:
             Updated Job object or None if not found
         """
-        try:
-            db_job = self.get_by_id(entity_id)
-            if not db_job:
-                return None
-
-            for key, value in data.items():
-                if hasattr(db_job, key) and value is not None:
-                    setattr(db_job, key, value)
+        values = {
+            key: value for key, value in data.items()
+            if key in UPDATABLE_COLUMNS and value is not None
+        }
+        if not values:
+            return self.get_by_id(entity_id)
 
+        try:
+            # Single UPDATE ... RETURNING instead of select, setattr, commit, refresh
+            db_job = self.db.execute(
+                update(Job).where(Job.id == entity_id).values(**values).returning(Job)
+            ).scalar_one_or_none()
             self.db.commit()
-            self.db.refresh(db_job)
-            logger.info(f"Updated job ID {entity_id}")
+            if db_job:
+                logger.info(f"Updated job ID {entity_id}")
             return db_job
         except Exception as e:
             self.db.rollback()
@@ -150,12 +159,11 @@ class JobRepository(IJobRepository):
             True if deleted, False if not found
         """
         try:
-            db_job = self.get_by_id(entity_id)
-            if not db_job:
+            result = self.db.execute(delete(Job).where(Job.id == entity_id))
+            self.db.commit()
+            if not result.rowcount:
                 return False
 
-            self.db.delete(db_job)
-            self.db.commit()
             logger.info(f"Deleted job ID {entity_id}")
             return True
         except Exception as e:
@@ -202,18 +210,28 @@ class JobRepository(IJobRepository):
                 )
                 query = query.filter(search_filter)
 
-            # Apply skills filter
+            # Apply skills filter: whole-word matches against the GIN-indexed
+            # description_tsv, all skills ANDed in one predicate
             if skills:
-                for skill in skills:
-                    query = query.filter(Job.description.ilike(f"%{skill}%"))
-
-            # Get total count before pagination
-            total = query.count()
-
-            # Apply pagination and ordering
-            jobs = query.order_by(desc(Job.date_applied)).offset(skip).limit(limit).all()
+                query = query.filter(Job.description_tsv.op("@@")(
+                    func.plainto_tsquery("english", " ".join(skills))
+                ))
+
+            # The window count rides along with the page, so one scan yields
+            # both; only a page past the end needs a separate count
+            rows = (
+                query.add_columns(func.count().over().label("total"))
+                .order_by(desc(Job.date_applied))
+                .offset(skip)
+                .limit(limit)
+                .all()
+            )
+            if rows:
+                total = rows[0].total
+            else:
+                total = query.count() if skip else 0
 
-            return jobs, total
+            return [row[0] for row in rows], total
         except Exception as e:
             logger.error(f"Error searching jobs: {str(e)}")
             raise DatabaseError(f"Failed to search jobs: {str(e)}")
@@ -230,33 +248,14 @@ class JobRepository(IJobRepository):
             List of dictionaries with skill name and count
         """
         try:
-            # Common tech skills to search for
-            common_skills = [
-                "python", "javascript", "java", "sql", "aws", "docker", "kubernetes",
-                "react", "node.js", "typescript", "git", "linux", "agile", "scrum",
-                "machine learning", "data analysis", "cloud computing", "devops",
-                "go", "rust", "c++", "c#", "ruby", "php", "swift", "kotlin",
-                "angular", "vue.js", "django", "flask", "spring", "microservices",
-                "postgresql", "mongodb", "redis", "elasticsearch", "kafka",
-                "terraform", "ansible", "jenkins", "ci/cd", "restful api", "graphql"
-            ]
-
-            skill_counts = []
-            for skill in common_skills:
-                count = (
-                    self.db.query(Job)
-                    .filter(
-                        Job.user_id == user_id,
-                        Job.description.ilike(f"%{skill}%")
-                    )
-                    .count()
-                )
-                if count > 0:
-                    skill_counts.append({"skill": skill, "count": count})
-
-            # Sort by count and limit results
-            skill_counts.sort(key=lambda x: x["count"], reverse=True)
-            return skill_counts[:limit]
+            # Counts come precomputed from the mv_top_skills materialized view
+            rows = self.db.execute(
+                select(top_skills_view.c.skill, top_skills_view.c.job_count)
+                .where(top_skills_view.c.user_id == user_id)
+                .order_by(desc(top_skills_view.c.job_count), top_skills_view.c.skill)
+                .limit(limit)
+            ).all()
+            return [{"skill": skill, "count": count} for skill, count in rows]
         except Exception as e:
             logger.error(f"Error getting skills statistics: {str(e)}")
             raise DatabaseError(f"Failed to get skills statistics: {str(e)}")
@@ -265,27 +264,39 @@ class JobRepository(IJobRepository):
         """
         Bulk create jobs (useful for scraped jobs)
 
+        Jobs whose url the user already has are skipped by the database.
+
         Args:
             jobs: List of job dictionaries
             user_id: User's Auth0 ID
 
         Returns:
-            List of created Job objects
+            List of created Job objects (duplicates excluded)
         """
-        try:
-            created_jobs = []
-            for job_data in jobs:
-                job_data["user_id"] = user_id
-                db_job = Job(**job_data)
-                self.db.add(db_job)
-                created_jobs.append(db_job)
+        if not jobs:
+            return []
 
+        try:
+            # One batched INSERT ... RETURNING instead of a flush per job;
+            # ix_jobs_user_url turns duplicates into no-ops
+            rows = [{**job_data, "user_id": user_id} for job_data in jobs]
+            stmt = (
+                pg_insert(Job)
+                .on_conflict_do_nothing(
+                    index_elements=["user_id", "url"],
+                    index_where=Job.url != ""
+                )
+                .returning(Job)
+            )
+            created_jobs = self.db.scalars(stmt, rows).all()
+            # RETURNING already loaded every column; detach the rows so commit
+            # doesn't expire them and trigger a SELECT per job on first access
+            for db_job in created_jobs:
+                self.db.expunge(db_job)
             self.db.commit()
-            for job in created_jobs:
-                self.db.refresh(job)
 
             logger.info(f"Bulk created {len(created_jobs)} jobs for user {user_id}")
-            return created_jobs
+            return list(created_jobs)
         except Exception as e:
             self.db.rollback()
             logger.error(f"Error bulk creating jobs: {str(e)}")
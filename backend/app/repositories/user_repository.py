@@ -3,18 +3,37 @@ User Repository Implementation
 Implements Repository Pattern for User entity data access
 """
 from typing import List, Optional, Dict, Any
-from sqlalchemy.orm import Session
-from app.interfaces.repository_interface import IUserRepository
+from cachetools import TTLCache
+from sqlalchemy.orm import Session, make_transient_to_detached
 from app.models.user import User
 from app.exceptions import DatabaseError
 import logging
+import threading
 
 logger = logging.getLogger(__name__)
 
+# Columns update() may write, resolved once instead of hasattr() per field
+UPDATABLE_COLUMNS = frozenset(
+    c.key for c in User.__table__.columns if not c.primary_key
+)
 
-class UserRepository(IUserRepository):
+# Column snapshots of recently loaded users, keyed by Auth0 ID. Shared across
+# sessions (and threadpool workers), so guarded by a lock; update() and
+# delete() drop the entry.
+USER_CACHE_TTL_SECONDS = 60
+_user_cache: TTLCache = TTLCache(maxsize=10_000, ttl=USER_CACHE_TTL_SECONDS)
+_user_cache_lock = threading.Lock()
+
+
+def _forget_user(auth_id: str) -> None:
+    """Drop a user from the lookup cache"""
+    with _user_cache_lock:
+        _user_cache.pop(auth_id, None)
+
+
+class UserRepository:
     """
-    Concrete implementation of User Repository
+    Concrete implementation of User Repository (satisfies IUserRepository)
 
     Handles all database operations for User entities
     """
@@ -39,7 +58,8 @@ class UserRepository(IUserRepository):
             User object or None if not found
         """
         try:
-            return self.db.query(User).filter(User.id == entity_id).first()
+            # Identity map first, then the mapper's cached primary-key loader
+            return self.db.get(User, entity_id)
         except Exception as e:
             logger.error(f"Error getting user by ID {entity_id}: {str(e)}")
             raise DatabaseError(f"Failed to retrieve user: {str(e)}")
@@ -48,6 +68,9 @@ class UserRepository(IUserRepository):
         """
         Get user by Auth0 ID
 
+        Served from a short-lived in-process cache when possible; a cached
+        row is attached to this session without a query.
+
         Args:
             auth_id: Auth0 user ID
 
@@ -55,7 +78,24 @@ class UserRepository(IUserRepository):
             User object or None if not found
         """
         try:
-            return self.db.query(User).filter(User.id == auth_id).first()
+            identity = self.db.identity_key(User, auth_id)
+            if identity in self.db.identity_map:
+                return self.db.identity_map[identity]
+
+            with _user_cache_lock:
+                snapshot = _user_cache.get(auth_id)
+            if snapshot is not None:
+                db_user = User(**snapshot)
+                make_transient_to_detached(db_user)
+                return self.db.merge(db_user, load=False)
+
+            # The Auth0 ID is the primary key
+            db_user = self.db.get(User, auth_id)
+            if db_user is not None:
+                snapshot = {c.key: getattr(db_user, c.key) for c in User.__table__.columns}
+                with _user_cache_lock:
+                    _user_cache[auth_id] = snapshot
+            return db_user
         except Exception as e:
             logger.error(f"Error getting user by auth ID {auth_id}: {str(e)}")
             raise DatabaseError(f"Failed to retrieve user: {str(e)}")
@@ -116,10 +156,11 @@ class UserRepository(IUserRepository):
                 return None
 
             for key, value in data.items():
-                if hasattr(db_user, key) and value is not None:
+                if value is not None and key in UPDATABLE_COLUMNS:
                     setattr(db_user, key, value)
 
             self.db.commit()
+            _forget_user(entity_id)
             self.db.refresh(db_user)
             logger.info(f"Updated user ID {entity_id}")
             return db_user
@@ -145,6 +186,7 @@ class UserRepository(IUserRepository):
 
             self.db.delete(db_user)
             self.db.commit()
+            _forget_user(entity_id)
             logger.info(f"Deleted user ID {entity_id}")
             return True
         except Exception as e:
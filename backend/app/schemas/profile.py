@@ -1,5 +1,5 @@
 # app/schemas/profile.py
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 from typing import Optional, List
 from datetime import datetime
 
@@ -23,8 +23,7 @@ class ProfileInDB(ProfileBase):
     id: int
     user_id: str
 
-    class Config:
-        orm_mode = True
+    model_config = ConfigDict(from_attributes=True)
 
 class ResumeBase(BaseModel):
     title: str
@@ -36,8 +35,7 @@ class Resume(ResumeBase):
     id: int
     upload_date: str
     
-    class Config:
-        orm_mode = True
+    model_config = ConfigDict(from_attributes=True)
 
 class Profile(ProfileInDB):
     resumes: List[Resume] = []
\ No newline at end of file
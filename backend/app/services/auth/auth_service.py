@@ -2,8 +2,11 @@
 Authentication Service
 Handles JWT token verification using Auth0
 """
+import hashlib
 import logging
+import time
 import jwt
+from cachetools import TTLCache
 from typing import Dict
 from app.interfaces.auth_interface import IAuthService, IJWKSProvider
 from app.exceptions import (
@@ -14,6 +17,16 @@ from app.exceptions import (
 
 logger = logging.getLogger(__name__)
 
+# Verified payloads are reused until the token's own exp; the cache TTL only
+# bounds how long an entry can linger
+TOKEN_CACHE_MAX_SIZE = 10_000
+TOKEN_CACHE_TTL_SECONDS = 3600
+
+
+def _token_fingerprint(token: str) -> bytes:
+    """16-byte digest of a token, used as the cache key instead of the JWT"""
+    return hashlib.blake2b(token.encode(), digest_size=16).digest()
+
 
 class Auth0Service(IAuthService):
     """
@@ -41,6 +54,10 @@ class Auth0Service(IAuthService):
         self.api_audience = api_audience
         self.jwks_provider = jwks_provider
         self.issuer = f'https://{domain}/'
+        self._token_cache: TTLCache = TTLCache(
+            maxsize=TOKEN_CACHE_MAX_SIZE,
+            ttl=TOKEN_CACHE_TTL_SECONDS
+        )
 
     async def verify_token(self, token: str) -> Dict:
         """
@@ -57,6 +74,11 @@ class Auth0Service(IAuthService):
             InvalidTokenError: If token is invalid
             AuthenticationError: For other auth failures
         """
+        fingerprint = _token_fingerprint(token)
+        cached = self._token_cache.get(fingerprint)
+        if cached is not None and cached.get("exp", 0) > time.time():
+            return cached
+
         try:
             logger.debug(f"Verifying token (length: {len(token)})")
 
@@ -84,6 +106,10 @@ class Auth0Service(IAuthService):
             logger.info("Token verified successfully")
             logger.debug(f"Token payload: {payload}")
 
+            # Skip the RSA check for repeat requests with this token
+            if "exp" in payload:
+                self._token_cache[fingerprint] = payload
+
             return payload
 
         except jwt.ExpiredSignatureError as e:
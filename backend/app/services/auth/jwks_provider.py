@@ -2,18 +2,46 @@
 JWKS Provider
 Handles fetching and caching of JSON Web Key Sets
 """
+import asyncio
 import logging
 import base64
-import requests
+import time
+import httpx
+from functools import lru_cache
 from typing import Dict, Optional
-from cryptography.hazmat.primitives.asymmetric.rsa import RSAPublicNumbers
+from cryptography.hazmat.primitives.asymmetric.rsa import RSAPublicKey, RSAPublicNumbers
 from cryptography.hazmat.backends import default_backend
-from cryptography.hazmat.primitives import serialization
 from app.interfaces.auth_interface import IJWKSProvider
 from app.exceptions import AuthenticationError
 
 logger = logging.getLogger(__name__)
 
+# How often the background task re-fetches the key set to pick up rotations
+JWKS_REFRESH_INTERVAL_SECONDS = 3600
+
+# Age after which a request re-validates the key set itself; the background
+# task normally refreshes first, so this only catches a stalled loop
+JWKS_CACHE_TTL_SECONDS = 2 * JWKS_REFRESH_INTERVAL_SECONDS
+
+JWKS_FETCH_TIMEOUT_SECONDS = 10
+
+
+@lru_cache(maxsize=64)
+def _public_key_from_numbers(e: int, n: int) -> RSAPublicKey:
+    """
+    Build an RSA public key object
+
+    Memoized on (e, n) so a refresh only converts keys that actually changed.
+
+    Args:
+        e: Public exponent
+        n: Modulus
+
+    Returns:
+        RSA public key, usable by jwt.decode without re-parsing
+    """
+    return RSAPublicNumbers(e=e, n=n).public_key(backend=default_backend())
+
 
 class Auth0JWKSProvider(IJWKSProvider):
     """
@@ -32,95 +60,175 @@ class Auth0JWKSProvider(IJWKSProvider):
         """
         self.auth0_domain = auth0_domain
         self.jwks_url = f'https://{auth0_domain}/.well-known/jwks.json'
-        self._cache: Dict[str, bytes] = {}
-
-    async def get_public_key(self, kid: str) -> bytes:
+        self._cache: Dict[str, RSAPublicKey] = {}
+        self._etag: Optional[str] = None
+        self._expires_at = 0.0
+        # Bumped on every successful refresh so waiters can tell one happened
+        self._generation = 0
+        self._lock = asyncio.Lock()
+        self._client: Optional[httpx.AsyncClient] = None
+        self._refresh_task: Optional[asyncio.Task] = None
+
+    async def get_public_key(self, kid: str) -> RSAPublicKey:
         """
         Get public key for token verification
 
+        Keys are served from the in-memory key map. A key set older than
+        JWKS_CACHE_TTL_SECONDS is re-validated first, and an unknown kid
+        triggers a refresh in case the signing keys have rotated; concurrent
+        callers share a single fetch.
+
         Args:
             kid: Key ID from token header
 
         Returns:
-            Public key in PEM format
+            RSA public key object
 
         Raises:
             AuthenticationError: If key cannot be retrieved
         """
-        # Check cache first
-        if kid in self._cache:
-            logger.debug(f"Using cached public key for kid: {kid}")
-            return self._cache[kid]
-
-        # Fetch from JWKS endpoint
-        try:
-            logger.info(f"Fetching JWKS from Auth0 for kid: {kid}")
-            jwks = requests.get(self.jwks_url, timeout=10).json()
-
-            # Find the signing key
-            signing_key = None
-            for key in jwks.get('keys', []):
-                if key.get('kid') == kid:
-                    signing_key = key
-                    break
+        if self._cache and time.monotonic() >= self._expires_at:
+            try:
+                await self._refresh_coalesced(self._generation)
+            except AuthenticationError as e:
+                logger.warning(f"JWKS revalidation failed, serving cached keys: {e.message}")
+
+        public_key = self._cache.get(kid)
+        if public_key is not None:
+            return public_key
 
-            if not signing_key:
-                raise AuthenticationError(f"Unable to find key with kid: {kid}")
+        logger.info(f"Unknown kid {kid}, refreshing JWKS")
+        await self._refresh_coalesced(self._generation)
 
-            # Convert JWK to PEM
-            public_key = self._jwk_to_pem(signing_key)
+        public_key = self._cache.get(kid)
+        if public_key is None:
+            raise AuthenticationError(f"Unable to find key with kid: {kid}")
+        return public_key
 
-            # Cache the key
-            self._cache[kid] = public_key
+    async def refresh(self) -> None:
+        """
+        Fetch the JWKS and rebuild the key map for every signing key
 
-            logger.info(f"Successfully retrieved and cached public key for kid: {kid}")
-            return public_key
+        Sends the last ETag so an unchanged key set costs a 304 and no
+        re-parsing.
 
-        except requests.RequestException as e:
+        Raises:
+            AuthenticationError: If the JWKS cannot be fetched or parsed
+        """
+        try:
+            headers = {"If-None-Match": self._etag} if self._etag and self._cache else {}
+            response = await self._get_client().get(self.jwks_url, headers=headers)
+
+            if response.status_code == 304:
+                logger.debug("JWKS not modified")
+            else:
+                response.raise_for_status()
+                jwks = response.json()
+
+                rsa_jwks = [
+                    key for key in jwks.get('keys', [])
+                    if key.get('kid') and key.get('kty') == 'RSA'
+                ]
+                # Build the keys off the event loop, all at once
+                public_keys = await asyncio.gather(
+                    *(asyncio.to_thread(self._jwk_to_key, key) for key in rsa_jwks)
+                )
+                keys: Dict[str, RSAPublicKey] = {
+                    key['kid']: public_key for key, public_key in zip(rsa_jwks, public_keys)
+                }
+
+                self._cache = keys
+                self._etag = response.headers.get("etag")
+                logger.info(f"Loaded {len(keys)} signing keys from JWKS")
+
+            self._expires_at = time.monotonic() + JWKS_CACHE_TTL_SECONDS
+            self._generation += 1
+
+        except httpx.HTTPError as e:
             logger.error(f"Error fetching JWKS: {str(e)}")
             raise AuthenticationError(f"Failed to fetch JWKS: {str(e)}")
+        except AuthenticationError:
+            raise
         except Exception as e:
             logger.error(f"Error processing JWKS: {str(e)}")
             raise AuthenticationError(f"Failed to process JWKS: {str(e)}")
 
+    def start_background_refresh(self) -> None:
+        """Start the periodic JWKS refresh task on the running event loop"""
+        if self._refresh_task is None or self._refresh_task.done():
+            self._refresh_task = asyncio.create_task(self._refresh_loop())
+
+    async def stop_background_refresh(self) -> None:
+        """Cancel the periodic JWKS refresh task"""
+        if self._refresh_task is not None:
+            self._refresh_task.cancel()
+            try:
+                await self._refresh_task
+            except asyncio.CancelledError:
+                pass
+            self._refresh_task = None
+
+    async def _refresh_loop(self) -> None:
+        """Re-fetch the key set every JWKS_REFRESH_INTERVAL_SECONDS"""
+        while True:
+            await asyncio.sleep(JWKS_REFRESH_INTERVAL_SECONDS)
+            try:
+                await self._refresh_coalesced(self._generation)
+            except AuthenticationError as e:
+                logger.warning(f"Scheduled JWKS refresh failed: {e.message}")
+
+    async def _refresh_coalesced(self, seen_generation: int) -> None:
+        """
+        Refresh unless another caller already did while we waited
+
+        Args:
+            seen_generation: Value of self._generation when the caller
+                decided a refresh was needed
+        """
+        async with self._lock:
+            if self._generation == seen_generation:
+                await self.refresh()
+
+    def _get_client(self) -> httpx.AsyncClient:
+        """Get the pooled HTTP client used for JWKS fetches (created lazily)"""
+        if self._client is None:
+            self._client = httpx.AsyncClient(timeout=JWKS_FETCH_TIMEOUT_SECONDS)
+        return self._client
+
+    async def aclose(self) -> None:
+        """Close the JWKS HTTP client"""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
     def clear_cache(self) -> None:
         """Clear the JWKS cache"""
         self._cache.clear()
+        self._etag = None
+        self._expires_at = 0.0
         logger.info("JWKS cache cleared")
 
-    def _jwk_to_pem(self, jwk: Dict) -> bytes:
+    def _jwk_to_key(self, jwk: Dict) -> RSAPublicKey:
         """
-        Convert JWK to PEM format
+        Convert JWK to an RSA public key object
 
         Args:
             jwk: JSON Web Key dictionary
 
         Returns:
-            Public key in PEM format
+            RSA public key
         """
         try:
             # Decode the exponent and modulus
             e = self._decode_value(jwk['e'])
             n = self._decode_value(jwk['n'])
 
-            # Create RSA public numbers
-            numbers = RSAPublicNumbers(e=e, n=n)
-
-            # Generate public key
-            public_key = numbers.public_key(backend=default_backend())
-
-            # Convert to PEM format
-            pem = public_key.public_bytes(
-                encoding=serialization.Encoding.PEM,
-                format=serialization.PublicFormat.SubjectPublicKeyInfo
-            )
-
-            return pem
+            return _public_key_from_numbers(e, n)
 
         except KeyError as e:
             raise AuthenticationError(f"Invalid JWK format: missing {str(e)}")
         except Exception as e:
-            raise AuthenticationError(f"Failed to convert JWK to PEM: {str(e)}")
+            raise AuthenticationError(f"Failed to convert JWK to public key: {str(e)}")
 
     @staticmethod
     def _ensure_bytes(key) -> bytes:
@@ -137,24 +245,23 @@ class Auth0JWKSProvider(IJWKSProvider):
             key = key.encode('utf-8')
         return key
 
-    @classmethod
-    def _decode_value(cls, val: str) -> int:
+    @staticmethod
+    @lru_cache(maxsize=64)
+    def _decode_value(val: str) -> int:
         """
         Decode base64url-encoded value to integer
 
+        Memoized: the same few live keys are decoded on every refresh.
+
         Args:
             val: Base64url-encoded string
 
         Returns:
             Decoded integer
         """
-        # Add padding if needed
-        val_bytes = cls._ensure_bytes(val)
-        padding = b'=' * (4 - len(val_bytes) % 4)
-        val_padded = val_bytes + padding
-
-        # Decode base64
-        decoded = base64.urlsafe_b64decode(val_padded)
+        # Pad to a multiple of 4 (no padding when already aligned)
+        val_bytes = Auth0JWKSProvider._ensure_bytes(val)
+        decoded = base64.urlsafe_b64decode(val_bytes + b'=' * (-len(val_bytes) % 4))
 
         # Convert to integer
         return int.from_bytes(decoded, 'big')
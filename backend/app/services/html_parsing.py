@@ -0,0 +1,15 @@
+"""
+HTML Parsing Helpers
+Shared BeautifulSoup configuration for the fetchers and scrapers
+"""
+import logging
+
+logger = logging.getLogger(__name__)
+
+try:
+    import lxml  # noqa: F401
+    # lxml's C parser builds the tree several times faster than html.parser
+    HTML_PARSER = "lxml"
+except ImportError:
+    logger.warning("lxml not installed, falling back to html.parser")
+    HTML_PARSER = "html.parser"
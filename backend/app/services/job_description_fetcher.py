@@ -2,15 +2,19 @@
 Job Description Fetcher
 Fetches detailed job descriptions from URLs
 """
+import asyncio
 import logging
 import httpx
-from bs4 import BeautifulSoup
+from selectolax.lexbor import LexborHTMLParser
 from typing import Optional
 from app.interfaces.job_scraper_interface import IJobDescriptionFetcher
 from app.exceptions import NetworkError
 
 logger = logging.getLogger(__name__)
 
+# Upper bound on in-flight requests per fetch_batch call
+BATCH_CONCURRENCY = 16
+
 
 class JobDescriptionFetcher(IJobDescriptionFetcher):
     """
@@ -45,13 +49,39 @@ class JobDescriptionFetcher(IJobDescriptionFetcher):
             ".description__text",  # LinkedIn
             ".jobDescriptionContent",  # Glassdoor
         ]
-
-    async def fetch(self, url: str) -> str:
+        # One selector group, so a lookup walks the document once
+        self._joined_description_selector = ", ".join(self.description_selectors)
+        self._client: Optional[httpx.AsyncClient] = None
+
+    def _new_client(self) -> httpx.AsyncClient:
+        """Build a keep-alive HTTP/2 client with the fetcher's defaults"""
+        return httpx.AsyncClient(
+            headers=self.headers,
+            timeout=self.timeout,
+            follow_redirects=True,
+            limits=httpx.Limits(max_connections=64, max_keepalive_connections=32),
+            http2=True
+        )
+
+    def _get_client(self) -> httpx.AsyncClient:
+        """Shared client, so repeat fetches reuse pooled connections"""
+        if self._client is None or self._client.is_closed:
+            self._client = self._new_client()
+        return self._client
+
+    async def aclose(self) -> None:
+        """Close the shared HTTP client"""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    async def fetch(self, url: str, client: Optional[httpx.AsyncClient] = None) -> str:
         """
         Fetch detailed job description from URL
 
         Args:
             url: Job posting URL
+            client: HTTP client to use; defaults to the fetcher's shared client
 
         Returns:
             Job description text
@@ -60,30 +90,27 @@ class JobDescriptionFetcher(IJobDescriptionFetcher):
             NetworkError: If fetching fails
         """
         try:
-            async with httpx.AsyncClient(
-                headers=self.headers,
-                timeout=self.timeout,
-                follow_redirects=True
-            ) as client:
-                logger.info(f"Fetching job description from: {url}")
-                response = await client.get(url)
-                response.raise_for_status()
+            client = client or self._get_client()
+            logger.info(f"Fetching job description from: {url}")
+            response = await client.get(url)
+            response.raise_for_status()
 
-                # Parse HTML
-                soup = BeautifulSoup(response.text, 'html.parser')
+            # Parse HTML with Lexbor; only simple CSS lookups and text
+            # extraction are needed here, which it does in C
+            tree = LexborHTMLParser(response.text)
 
-                # Try specific selectors first
-                description = self._extract_with_selectors(soup)
+            # Try specific selectors first
+            description = self._extract_with_selectors(tree)
 
-                # Fallback to generic extraction
-                if not description:
-                    description = self._extract_generic(soup)
+            # Fallback to generic extraction
+            if not description:
+                description = self._extract_generic(tree)
 
-                if not description:
-                    logger.warning(f"No description found for URL: {url}")
-                    return "Description not available"
+            if not description:
+                logger.warning(f"No description found for URL: {url}")
+                return "Description not available"
 
-                return description
+            return description
 
         except httpx.HTTPStatusError as e:
             logger.error(f"HTTP error fetching {url}: {e.response.status_code}")
@@ -95,53 +122,53 @@ class JobDescriptionFetcher(IJobDescriptionFetcher):
             logger.error(f"Unexpected error fetching {url}: {str(e)}")
             raise NetworkError(f"Failed to fetch description: {str(e)}")
 
-    def _extract_with_selectors(self, soup: BeautifulSoup) -> Optional[str]:
+    def _extract_with_selectors(self, tree: LexborHTMLParser) -> Optional[str]:
         """
         Extract description using predefined selectors
 
         Args:
-            soup: BeautifulSoup object
+            tree: Parsed HTML document
 
         Returns:
             Extracted description or None
         """
+        # Collect every candidate in one pass, then keep the selectors'
+        # priority: per selector, the first candidate it matches
+        candidates = tree.css(self._joined_description_selector)
         for selector in self.description_selectors:
-            element = soup.select_one(selector)
+            element = next((node for node in candidates if node.css_matches(selector)), None)
             if element:
-                text = element.get_text(separator=' ', strip=True)
+                text = element.text(separator=' ', strip=True)
                 if text and len(text) > 50:  # Ensure it's substantial
                     logger.debug(f"Found description with selector: {selector}")
                     return text
 
         return None
 
-    def _extract_generic(self, soup: BeautifulSoup) -> Optional[str]:
+    def _extract_generic(self, tree: LexborHTMLParser) -> Optional[str]:
         """
         Generic fallback extraction method
 
         Args:
-            soup: BeautifulSoup object
+            tree: Parsed HTML document
 
         Returns:
             Extracted description or None
         """
-        # Try main, article, or body
-        containers = [
-            soup.select_one("main"),
-            soup.select_one("article"),
-            soup.select_one("body")
-        ]
-
-        for container in containers:
+        # Try main, article, or body. Looked up one at a time: a node removed
+        # by an earlier pass must not be held on to
+        for selector in ("main", "article", "body"):
+            container = tree.css_first(selector)
             if not container:
                 continue
 
-            # Remove non-content elements
-            for element in container.select("nav, header, footer, script, style, aside"):
+            # Remove non-content elements, innermost first so no freed node
+            # is touched again
+            for element in reversed(container.css("nav, header, footer, script, style, aside")):
                 element.decompose()
 
             # Get text
-            text = container.get_text(separator=' ', strip=True)
+            text = container.text(separator=' ', strip=True)
 
             if text and len(text) > 100:
                 logger.debug("Found description using generic extraction")
@@ -161,17 +188,22 @@ class JobDescriptionFetcher(IJobDescriptionFetcher):
         Returns:
             Dictionary mapping URLs to descriptions
         """
-        import asyncio
-
-        async def _fetch_all():
-            results = {}
-            for url in urls:
+        async def _fetch_one(client: httpx.AsyncClient, semaphore: asyncio.Semaphore, url: str) -> str:
+            async with semaphore:
                 try:
-                    description = await self.fetch(url)
-                    results[url] = description
+                    return await self.fetch(url, client)
                 except Exception as e:
                     logger.error(f"Error fetching {url}: {str(e)}")
-                    results[url] = "Error fetching description"
-            return results
+                    return "Error fetching description"
+
+        async def _fetch_all():
+            # asyncio.run() starts a fresh loop, so the batch gets its own
+            # client rather than the shared one bound to another loop
+            semaphore = asyncio.Semaphore(BATCH_CONCURRENCY)
+            async with self._new_client() as client:
+                descriptions = await asyncio.gather(
+                    *(_fetch_one(client, semaphore, url) for url in urls)
+                )
+            return dict(zip(urls, descriptions))
 
         return asyncio.run(_fetch_all())
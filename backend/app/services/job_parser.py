@@ -1,17 +1,64 @@
 import httpx
-import requests
-from bs4 import BeautifulSoup
-from typing import Dict, List
+from bs4 import BeautifulSoup, Tag
+from app.services.html_parsing import HTML_PARSER
+import soupsieve
+from typing import Dict, List, Optional
 import logging
 import json
 import re
-import spacy
 from urllib.parse import urlparse
 
 logger = logging.getLogger(__name__)
 
+# Only NER is used (company detection), so skip the rest of the pipeline
+SPACY_DISABLED_PIPES = ["parser", "lemmatizer", "tagger", "attribute_ruler"]
+
+# Compiled once; case-sensitive on purpose, the [A-Z] anchors find proper names
+COMPANY_PATTERNS = [
+    re.compile(pattern) for pattern in (
+        # "Company Name is hiring" pattern
+        r'(?:^|\s)([A-Z][A-Za-z0-9\s&,.]{2,50}?)(?:\s+is\s+(?:hiring|looking|seeking))',
+        
+        # "Join Company Name" pattern
+        r'[Jj]oin\s+(?:the\s+)?([A-Z][A-Za-z0-9\s&,.]{2,50}?)(?:\s+team|\s+today|\s+now|[!.])',
+        
+        # "About Company Name" pattern
+        r'[Aa]bout\s+([A-Z][A-Za-z0-9\s&,.]{2,50}?)(?:\n|\.|$)',
+        
+        # "Work at Company Name" pattern
+        r'[Ww]ork(?:ing)?\s+(?:at|with|for)\s+([A-Z][A-Za-z0-9\s&,.]{2,50}?)(?:\.|,|\n)',
+        
+        # "Company Name Careers" pattern
+        r'^([A-Z][A-Za-z0-9\s&,.]{2,50}?)\s+[Cc]areers?(?:\s|$)',
+    )
+]
+
+# Start of the requirements section: the earliest of these markers
+REQUIREMENT_MARKER_RE = re.compile(
+    r"requirements|qualifications|what you(?:'|\u2019)ll need|"
+    r"what we(?:'|\u2019)re looking for|skills",
+    re.IGNORECASE
+)
+
+# Job type keywords, one group per type; listed in priority order
+JOB_TYPE_RE = re.compile(
+    r"(?P<full_time>full[- ]time|permanent)"
+    r"|(?P<part_time>part[- ]time)"
+    r"|(?P<contract>contract|temporary|interim)"
+    r"|(?P<internship>intern|trainee)",
+    re.IGNORECASE
+)
+JOB_TYPE_LABELS = {
+    'full_time': 'full-time',
+    'part_time': 'part-time',
+    'contract': 'contract',
+    'internship': 'internship',
+}
+
 class JobParser:
     def __init__(self):
+        self._client: Optional[httpx.AsyncClient] = None
+        self._nlp = None
         self.headers = {
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
             'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
@@ -48,23 +95,94 @@ class JobParser:
                 '[data-job-description]'
             ]
         }
-        
-        try:
-            self.nlp = spacy.load("en_core_web_sm")
-            logger.info("spaCy model loaded successfully")
-        except Exception as e:
-            logger.error(f"Error loading spaCy model: {str(e)}")
-            raise
+        self.content_selectors = [
+            'main',
+            'article',
+            '#content',
+            '.content',
+            '.job-posting',
+            '.job-details'
+        ]
+        # Selectors compiled once rather than re-parsed on every lookup.
+        # Each list is also joined into one selector group, so a lookup
+        # walks the document once instead of once per selector
+        self._compiled_selectors = {
+            key: [soupsieve.compile(selector) for selector in selectors]
+            for key, selectors in self.selectors.items()
+        }
+        self._joined_selectors = {
+            key: soupsieve.compile(', '.join(selectors))
+            for key, selectors in self.selectors.items()
+        }
+        self._compiled_content_selectors = [
+            soupsieve.compile(selector) for selector in self.content_selectors
+        ]
+        self._joined_content_selector = soupsieve.compile(', '.join(self.content_selectors))
+        self._meta_selectors = [
+            soupsieve.compile(selector) for selector in (
+                'meta[property="og:site_name"]',
+                'meta[name="author"]',
+                'meta[name="publisher"]'
+            )
+        ]
+        self._noise_selector = soupsieve.compile('script, style, nav, header, footer, iframe, noscript')
+
+    @property
+    def nlp(self):
+        """spaCy NER pipeline, loaded on first use (most parses never need it)"""
+        if self._nlp is None:
+            import spacy
 
-    def _find_element_by_selectors(self, soup: BeautifulSoup, selectors: List[str]) -> str:
-        """Find element using multiple possible selectors"""
-        for selector in selectors:
             try:
-                element = soup.select_one(selector)
-                if element:
-                    return element.get_text().strip()
-            except Exception:
-                continue
+                self._nlp = spacy.load("en_core_web_sm", disable=SPACY_DISABLED_PIPES)
+                logger.info("spaCy model loaded successfully")
+            except Exception as e:
+                logger.error(f"Error loading spaCy model: {str(e)}")
+                raise
+        return self._nlp
+
+    def _get_client(self) -> httpx.AsyncClient:
+        """Get the shared HTTP client, opening it on first use"""
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(headers=self.headers, http2=True, timeout=30.0)
+        return self._client
+
+    async def aclose(self) -> None:
+        """Close the shared HTTP client"""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    def _select_by_priority(
+        self,
+        soup: BeautifulSoup,
+        selectors: List[soupsieve.SoupSieve],
+        joined: soupsieve.SoupSieve
+    ) -> Optional[Tag]:
+        """
+        Find the first element for the highest-priority matching selector
+
+        One pass collects every candidate for the joined selector group; the
+        candidates are then checked against each selector in order, which
+        keeps the list's priority instead of document order.
+        """
+        candidates = joined.select(soup)
+        for selector in selectors:
+            for element in candidates:
+                if selector.match(element):
+                    return element
+        return None
+
+    def _find_element_by_selectors(self, soup: BeautifulSoup, field: str) -> str:
+        """Find element using multiple possible selectors"""
+        try:
+            element = self._select_by_priority(
+                soup, self._compiled_selectors[field], self._joined_selectors[field]
+            )
+            if element:
+                return element.get_text().strip()
+        except Exception:
+            pass
         return ""
 
     def _extract_from_structured_data(self, soup: BeautifulSoup) -> str:
@@ -88,14 +206,8 @@ class JobParser:
                     continue
                     
             # Try to find meta tags
-            meta_selectors = [
-                'meta[property="og:site_name"]',
-                'meta[name="author"]',
-                'meta[name="publisher"]'
-            ]
-            
-            for selector in meta_selectors:
-                meta = soup.select_one(selector)
+            for selector in self._meta_selectors:
+                meta = selector.select_one(soup)
                 if meta and meta.get('content'):
                     cleaned_name = self._clean_company_name(meta['content'])
                     if self._validate_company_name(cleaned_name):
@@ -214,27 +326,10 @@ class JobParser:
                 return company_from_structured
 
             # 2. Try common text patterns with more robust regex
-            company_patterns = [
-                # "Company Name is hiring" pattern
-                r'(?:^|\s)([A-Z][A-Za-z0-9\s&,.]{2,50}?)(?:\s+is\s+(?:hiring|looking|seeking))',
-                
-                # "Join Company Name" pattern
-                r'[Jj]oin\s+(?:the\s+)?([A-Z][A-Za-z0-9\s&,.]{2,50}?)(?:\s+team|\s+today|\s+now|[!.])',
-                
-                # "About Company Name" pattern
-                r'[Aa]bout\s+([A-Z][A-Za-z0-9\s&,.]{2,50}?)(?:\n|\.|$)',
-                
-                # "Work at Company Name" pattern
-                r'[Ww]ork(?:ing)?\s+(?:at|with|for)\s+([A-Z][A-Za-z0-9\s&,.]{2,50}?)(?:\.|,|\n)',
-                
-                # "Company Name Careers" pattern
-                r'^([A-Z][A-Za-z0-9\s&,.]{2,50}?)\s+[Cc]areers?(?:\s|$)',
-            ]
-
-            for pattern in company_patterns:
-                matches = re.findall(pattern, text)
-                if matches:
-                    company = matches[0].strip()
+            for pattern in COMPANY_PATTERNS:
+                match = pattern.search(text)
+                if match:
+                    company = match.group(1).strip()
                     # Clean up the extracted company name
                     company = self._clean_company_name(company)
                     if self._validate_company_name(company):
@@ -279,38 +374,26 @@ class JobParser:
             domain = urlparse(url).netloc
             logger.info(f"Parsing job from domain: {domain}")
             
-            async with httpx.AsyncClient() as client:
-                response = await client.get(url, headers=self.headers, timeout=30.0)
-                response.raise_for_status()
+            response = await self._get_client().get(url)
+            response.raise_for_status()
             
-            soup = BeautifulSoup(response.text, 'html.parser')
+            soup = BeautifulSoup(response.text, HTML_PARSER)
             
             # Extract sections using common selectors
-            title = self._find_element_by_selectors(soup, self.selectors['title'])
-            initial_company = self._find_element_by_selectors(soup, self.selectors['company'])
-            location = self._find_element_by_selectors(soup, self.selectors['location'])
+            title = self._find_element_by_selectors(soup, 'title')
+            initial_company = self._find_element_by_selectors(soup, 'company')
+            location = self._find_element_by_selectors(soup, 'location')
             
             # Get main content area
-            main_content = None
-            content_selectors = [
-                'main',
-                'article',
-                '#content',
-                '.content',
-                '.job-posting',
-                '.job-details'
-            ]
-            
-            for selector in content_selectors:
-                main_content = soup.select_one(selector)
-                if main_content:
-                    break
+            main_content = self._select_by_priority(
+                soup, self._compiled_content_selectors, self._joined_content_selector
+            )
             
             if not main_content:
                 main_content = soup.body
             
             # Remove unwanted elements
-            for element in main_content.select('script, style, nav, header, footer, iframe, noscript'):
+            for element in self._noise_selector.select(main_content):
                 element.decompose()
             
             # Get text content
@@ -341,24 +424,9 @@ class JobParser:
             'requirements': ''
         }
         
-        # Common section markers
-        requirement_markers = [
-            'requirements',
-            'qualifications',
-            'what you\'ll need',
-            'what we\'re looking for',
-            'skills'
-        ]
-        
-        text_lower = text.lower()
-        req_index = -1
-        
-        # Find where requirements section starts
-        for marker in requirement_markers:
-            index = text_lower.find(marker)
-            if index != -1:
-                if req_index == -1 or index < req_index:
-                    req_index = index
+        # One scan finds the earliest marker
+        match = REQUIREMENT_MARKER_RE.search(text)
+        req_index = match.start() if match else -1
         
         if req_index != -1:
             sections['description'] = text[:req_index].strip()
@@ -370,17 +438,15 @@ class JobParser:
 
     def _extract_job_type(self, text: str) -> str:
         """Extract job type using patterns"""
-        job_types = {
-            'full-time': ['full time', 'full-time', 'permanent'],
-            'part-time': ['part time', 'part-time'],
-            'contract': ['contract', 'temporary', 'interim'],
-            'internship': ['intern', 'internship', 'trainee']
-        }
-        
-        text_lower = text.lower()
+        # One scan collects every type mentioned; the highest priority wins
+        found = set()
+        for match in JOB_TYPE_RE.finditer(text):
+            found.add(match.lastgroup)
+            if match.lastgroup == 'full_time':
+                break
         
-        for job_type, patterns in job_types.items():
-            if any(pattern in text_lower for pattern in patterns):
+        for group, job_type in JOB_TYPE_LABELS.items():
+            if group in found:
                 return job_type
         
         return "full-time"  # Default
@@ -10,6 +10,7 @@ import httpx
 from fastapi import BackgroundTasks
 from fastapi.responses import JSONResponse
 from bs4 import BeautifulSoup
+from app.services.html_parsing import HTML_PARSER
 import pandas as pd
 from jobspy import scrape_jobs
 
@@ -157,7 +158,7 @@ class JobScraperService:
                     # Run jobspy in a separate thread since it's not async
                     jobspy_results = await asyncio.to_thread(scrape_jobs, **jobspy_params)
                     if jobspy_results is not None and not jobspy_results.empty:
-                        for _, row in jobspy_results.iterrows():
+                        for row in jobspy_results.to_dict("records"):
                             # Handle None values from jobspy
                             title = row.get("title") or ""
                             company = row.get("company") or "Unknown Company"
@@ -212,7 +213,7 @@ class JobScraperService:
                 response = await client.get(url)
                 response.raise_for_status()
                 
-                soup = BeautifulSoup(response.text, 'html.parser')
+                soup = BeautifulSoup(response.text, HTML_PARSER)
                 
                 selectors = [
                     ".job-description",
@@ -301,7 +302,7 @@ class JobScraperService:
                 response = await client.get(url)
                 response.raise_for_status()
                 
-                soup = BeautifulSoup(response.text, 'html.parser')
+                soup = BeautifulSoup(response.text, HTML_PARSER)
                 job_listings = soup.select(config["results_selector"])
                 
                 logger.info(f"Found {len(job_listings)} job listings on {site_name} page {page_start}")
@@ -84,7 +84,7 @@ class JobSearchService:
             for site_name, scraper in site_scraper_pairs:
                 try:
                     # Create site-specific params
-                    site_params = params.copy(update={'site_name': site_name})
+                    site_params = params.model_copy(update={'site_name': site_name})
 
                     # Execute search
                     results = await scraper.search(site_params)
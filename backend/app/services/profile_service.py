@@ -1,43 +1,73 @@
 # app/services/profile_service.py
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
 from fastapi import HTTPException, UploadFile
+import asyncio
+import contextlib
 import os
 from datetime import datetime
+from typing import BinaryIO
 
 from backend.app.models.resume import Profile, Resume
 from app.schemas.profile import ProfileCreate, ProfileUpdate
 
+RESUME_CHUNK_SIZE = 64 * 1024
+MAX_RESUME_SIZE_BYTES = 10 * 1024 * 1024
+
+
+class ResumeTooLargeError(Exception):
+    pass
+
+
+def _copy_in_chunks(source: BinaryIO, file_path: str) -> None:
+    """Copy an upload to disk chunk by chunk, enforcing the size limit"""
+    written = 0
+    try:
+        with open(file_path, "wb") as file_object:
+            while chunk := source.read(RESUME_CHUNK_SIZE):
+                written += len(chunk)
+                if written > MAX_RESUME_SIZE_BYTES:
+                    raise ResumeTooLargeError()
+                file_object.write(chunk)
+    except BaseException:
+        # Never leave a partial upload behind, whatever interrupted the copy
+        with contextlib.suppress(FileNotFoundError):
+            os.remove(file_path)
+        raise
+
 class ProfileService:
-    def __init__(self, db: Session):
+    def __init__(self, db: AsyncSession):
         self.db = db
 
-    def get_profile_by_user_id(self, user_id: str) -> Profile:
-        return self.db.query(Profile).filter(Profile.user_id == user_id).first()
+    async def get_profile_by_user_id(self, user_id: str) -> Profile:
+        result = await self.db.execute(select(Profile).where(Profile.user_id == user_id))
+        return result.scalar_one_or_none()
 
-    def create_profile(self, user_id: str, profile_data: ProfileCreate) -> Profile:
+    async def create_profile(self, user_id: str, profile_data: ProfileCreate) -> Profile:
         db_profile = Profile(
             user_id=user_id,
-            **profile_data.dict()
+            **profile_data.model_dump()
         )
         self.db.add(db_profile)
-        self.db.commit()
-        self.db.refresh(db_profile)
+        await self.db.commit()
+        await self.db.refresh(db_profile)
         return db_profile
 
-    def update_profile(self, user_id: str, profile_data: ProfileUpdate) -> Profile:
-        profile = self.get_profile_by_user_id(user_id)
+    async def update_profile(self, user_id: str, profile_data: ProfileUpdate) -> Profile:
+        profile = await self.get_profile_by_user_id(user_id)
         if not profile:
             raise HTTPException(status_code=404, detail="Profile not found")
         
-        for field, value in profile_data.dict().items():
+        for field, value in profile_data.model_dump().items():
             setattr(profile, field, value)
         
-        self.db.commit()
-        self.db.refresh(profile)
+        await self.db.commit()
+        await self.db.refresh(profile)
         return profile
 
     async def upload_resume(self, user_id: str, title: str, file: UploadFile) -> Resume:
-        profile = self.get_profile_by_user_id(user_id)
+        profile = await self.get_profile_by_user_id(user_id)
         if not profile:
             raise HTTPException(status_code=404, detail="Profile not found")
 
@@ -47,8 +77,10 @@ class ProfileService:
 
         # Save file
         file_path = f"{upload_dir}/{datetime.now().strftime('%Y%m%d_%H%M%S')}_{file.filename}"
-        with open(file_path, "wb+") as file_object:
-            file_object.write(await file.read())
+        try:
+            await asyncio.to_thread(_copy_in_chunks, file.file, file_path)
+        except ResumeTooLargeError:
+            raise HTTPException(status_code=413, detail="Resume file is too large")
 
         # Create resume record
         resume = Resume(
@@ -59,25 +91,34 @@ class ProfileService:
         )
         
         self.db.add(resume)
-        self.db.commit()
-        self.db.refresh(resume)
+        await self.db.commit()
+        await self.db.refresh(resume)
         return resume
 
-    def get_resumes(self, user_id: str) -> list[Resume]:
-        profile = self.get_profile_by_user_id(user_id)
+    async def get_resumes(self, user_id: str) -> list[Resume]:
+        # Lazy relationship loading isn't available on AsyncSession, so eager-load
+        result = await self.db.execute(
+            select(Profile)
+            .options(selectinload(Profile.resumes))
+            .where(Profile.user_id == user_id)
+        )
+        profile = result.scalar_one_or_none()
         if not profile:
             raise HTTPException(status_code=404, detail="Profile not found")
         return profile.resumes
 
     async def delete_resume(self, user_id: str, resume_id: int):
-        profile = self.get_profile_by_user_id(user_id)
+        profile = await self.get_profile_by_user_id(user_id)
         if not profile:
             raise HTTPException(status_code=404, detail="Profile not found")
 
-        resume = self.db.query(Resume).filter(
-            Resume.id == resume_id,
-            Resume.profile_id == profile.id
-        ).first()
+        result = await self.db.execute(
+            select(Resume).where(
+                Resume.id == resume_id,
+                Resume.profile_id == profile.id
+            )
+        )
+        resume = result.scalar_one_or_none()
 
         if not resume:
             raise HTTPException(status_code=404, detail="Resume not found")
@@ -86,5 +127,5 @@ class ProfileService:
         if os.path.exists(resume.file_path):
             os.remove(resume.file_path)
 
-        self.db.delete(resume)
-        self.db.commit()
\ No newline at end of file
+        await self.db.delete(resume)
+        await self.db.commit()
\ No newline at end of file
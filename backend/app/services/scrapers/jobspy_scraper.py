@@ -76,11 +76,12 @@ class JobspyScraper(BaseScraper):
                 logger.warning(f"No results from jobspy for sites: {sites_to_search}")
                 return []
 
-            # Convert DataFrame to list of dictionaries
-            results = []
-            for _, row in jobspy_results.iterrows():
-                job_data = self._convert_jobspy_row(row, params.search_term)
-                results.append(job_data)
+            # Convert DataFrame to list of dictionaries; to_dict("records") avoids
+            # building a pandas Series per row the way iterrows() does
+            results = [
+                self._convert_jobspy_row(row, params.search_term)
+                for row in jobspy_results.to_dict("records")
+            ]
 
             logger.info(f"Jobspy returned {len(results)} jobs")
             return results
@@ -122,7 +123,7 @@ class JobspyScraper(BaseScraper):
         Convert jobspy DataFrame row to job dictionary
 
         Args:
-            row: Pandas DataFrame row
+            row: DataFrame record as a dictionary
             search_term: Search term used
 
         Returns:
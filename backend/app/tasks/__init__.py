@@ -1,11 +1,12 @@
 from celery import Celery
+from app.config import settings
 
 # Configure Celery
 app = Celery(
     'tasks',
-    broker='redis://redis:6379/0',
-    backend='redis://redis:6379/0',
-    include=['app.tasks.job_scraper']
+    broker=settings.REDIS_URL,
+    backend=settings.REDIS_URL,
+    include=['app.tasks.job_scraper', 'app.tasks.job_parser']
 )
 
 # Configure task execution
@@ -29,6 +30,10 @@ from celery.schedules import crontab
 from datetime import timedelta
 
 app.conf.beat_schedule = {
+    'refresh-top-skills': {
+        'task': 'app.tasks.job_scraper.refresh_top_skills_task',
+        'schedule': timedelta(minutes=15),  # Pick up manually added jobs
+    },
     'periodic-job-scraping': {
         'task': 'app.tasks.job_scraper.periodic_scrape_jobs',
         'schedule': timedelta(hours=3),  # Run every 3 hours
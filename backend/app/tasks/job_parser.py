@@ -0,0 +1,28 @@
+from celery import shared_task
+from app.services.job_parser import job_parser
+import asyncio
+import logging
+from typing import Dict
+
+logger = logging.getLogger(__name__)
+
+async def _parse_job_posting(url: str) -> Dict:
+    try:
+        return await job_parser.parse_job_posting(url)
+    finally:
+        # Each task runs on a fresh event loop, so don't keep the client around
+        await job_parser.aclose()
+
+@shared_task
+def parse_job_task(url: str) -> Dict:
+    """
+    Celery task to parse a job posting URL
+    
+    Args:
+        url: Job posting URL
+    
+    Returns:
+        Dict containing the parsed job fields
+    """
+    logger.info(f"Parsing job posting: {url}")
+    return asyncio.run(_parse_job_posting(url))
@@ -1,13 +1,32 @@
 from celery import shared_task
 from app.services.job_scraper import JobScraperService
 import logging
+from app.cache import invalidate_sync
 from app.database import SessionLocal
-from sqlalchemy.orm import Session
+from app.models.job import REFRESH_TOP_SKILLS
+import asyncio
 from typing import Dict, List
 import json
 
 logger = logging.getLogger(__name__)
 
+@shared_task
+def refresh_top_skills_task() -> None:
+    """
+    Recompute the mv_top_skills materialized view and drop the cached
+    top-skills responses built from the old contents
+    """
+    db = SessionLocal()
+    try:
+        db.execute(REFRESH_TOP_SKILLS)
+        db.commit()
+        invalidate_sync("skills:*")
+    except Exception as e:
+        db.rollback()
+        logger.error(f"Error refreshing top skills: {str(e)}")
+    finally:
+        db.close()
+
 @shared_task(bind=True)
 def scrape_jobs_task(self, task_id: str, params: Dict) -> Dict:
     """
@@ -21,9 +40,6 @@ def scrape_jobs_task(self, task_id: str, params: Dict) -> Dict:
         Dict containing task status and results
     """
     try:
-        # Create database session
-        db = SessionLocal()
-        
         # Convert params to JobSearchParams
         from app.services.job_scraper import JobSearchParams
         search_params = JobSearchParams(**params)
@@ -32,26 +48,7 @@ def scrape_jobs_task(self, task_id: str, params: Dict) -> Dict:
         scraper = JobScraperService()
         
         # Start job search
-        results = scraper.search_jobs(search_params)
-        
-        # Store results in database
-        for job_data in results:
-            try:
-                from app.models.job import Job
-                job = Job(
-                    title=job_data.get('title', ''),
-                    company=job_data.get('company', ''),
-                    location=job_data.get('location', ''),
-                    url=job_data.get('url', ''),
-                    source=job_data.get('source', ''),
-                    date_posted=job_data.get('date_posted', ''),
-                    search_term=job_data.get('search_term', '')
-                )
-                db.add(job)
-            except Exception as e:
-                logger.error(f"Error saving job to database: {str(e)}")
-        
-        db.commit()
+        results = asyncio.run(scraper.search_jobs(search_params))
         
         # Update task status
         self.update_state(state='SUCCESS', meta={'results': results})
@@ -69,9 +66,6 @@ def scrape_jobs_task(self, task_id: str, params: Dict) -> Dict:
             'status': 'failed',
             'error': str(e)
         }
-    finally:
-        if 'db' in locals():
-            db.close()
 
 @shared_task
 async def check_job_status() -> None:
@@ -105,9 +99,6 @@ async def periodic_scrape_jobs(
         fetch_description: Whether to fetch job descriptions
     """
     try:
-        # Create database session
-        db = SessionLocal()
-        
         # Initialize job scraper
         scraper = JobScraperService()
         
@@ -127,30 +118,9 @@ async def periodic_scrape_jobs(
             logger.info(f"Starting periodic job scraping for: {search_term} on sites: {sites}")
             
             # Run the job search
-            results = scraper.search_jobs(params)
-            
-            # Store results in database
-            for job_data in results:
-                try:
-                    from app.models.job import Job
-                    job = Job(
-                        title=job_data.get('title', ''),
-                        company=job_data.get('company', ''),
-                        location=job_data.get('location', ''),
-                        url=job_data.get('url', ''),
-                        source=job_data.get('source', ''),
-                        date_posted=job_data.get('date_posted', ''),
-                        search_term=job_data.get('search_term', '')
-                    )
-                    db.add(job)
-                except Exception as e:
-                    logger.error(f"Error saving job to database: {str(e)}")
+            results = await scraper.search_jobs(params)
         
-        db.commit()
         logger.info(f"Completed periodic job scraping - found {len(results)} jobs")
         
     except Exception as e:
         logger.error(f"Error in periodic job scraping: {str(e)}")
-    finally:
-        if 'db' in locals():
-            db.close()
@@ -29,11 +29,7 @@ mkdir -p app/migrations/versions
 
 # Run Alembic migrations
 echo "Running database migrations..."
-alembic upgrade head || (
-  echo "Creating initial migrations..."
-  alembic revision --autogenerate -m "Initial migration"
-  alembic upgrade head
-)
+alembic upgrade head
 
 # Then run the application
 echo "Starting application..."
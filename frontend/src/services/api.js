@@ -37,16 +37,27 @@ api.interceptors.response.use(
   }
 );
 
+// Largest page /jobs/ serves
+const JOBS_PAGE_SIZE = 200;
+
 export const jobService = {
 
   getAllJobs: async (token) => {
     try {
-      const response = await api.get('/jobs/', {
-        headers: {
-          Authorization: `Bearer ${token}`
+      // The endpoint is paginated; keep requesting pages until a short one
+      const jobs = [];
+      for (let offset = 0; ; offset += JOBS_PAGE_SIZE) {
+        const response = await api.get('/jobs/', {
+          params: { limit: JOBS_PAGE_SIZE, offset },
+          headers: {
+            Authorization: `Bearer ${token}`
+          }
+        });
+        jobs.push(...response.data);
+        if (response.data.length < JOBS_PAGE_SIZE) {
+          return jobs;
         }
-      });
-      return response.data;
+      }
     } catch (error) {
       console.error('Error fetching jobs:', error);
       throw error;
@@ -97,12 +108,22 @@ export const jobService = {
 
   parseJobUrl: async (url, token) => {
     try {
-      const response = await api.post('/jobs/parse-url', { url }, {
-        headers: {
-          Authorization: `Bearer ${token}`
+      const headers = { Authorization: `Bearer ${token}` };
+      const response = await api.post('/jobs/parse-url', { url }, { headers });
+
+      // Parsing runs on a worker; poll the task until it settles
+      const taskId = response.data.task_id;
+      for (let attempt = 0; attempt < 30; attempt++) {
+        await new Promise((resolve) => setTimeout(resolve, 1000));
+        const task = await api.get(`/tasks/${taskId}`, { headers });
+        if (task.data.state === 'SUCCESS') {
+          return task.data.result;
         }
-      });
-      return response.data;
+        if (task.data.state === 'FAILURE') {
+          throw new Error(task.data.error);
+        }
+      }
+      throw new Error('Timed out waiting for job URL to be parsed');
     } catch (error) {
       console.error('Error parsing job URL:', error);
       throw error;